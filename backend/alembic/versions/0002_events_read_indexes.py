@@ -0,0 +1,27 @@
+"""covering index for upcoming-events scans, trigram indexes for search"""
+from alembic import op
+
+revision = '0002_events_read_indexes'
+down_revision = '0001_init'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # feed/search/similar all do WHERE start_time > NOW() ORDER BY start_time;
+    # carry the short display columns in the index. description stays out:
+    # scraped HTML descriptions can exceed the ~2.7kB btree tuple limit.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_upcoming "
+        "ON events (start_time) INCLUDE (id, title, location, tags, url)"
+    )
+
+    # /events/search filters with ILIKE '%q%'
+    op.execute("CREATE INDEX IF NOT EXISTS ix_events_title_trgm ON events USING gin (title gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_events_description_trgm ON events USING gin (description gin_trgm_ops)")
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_events_description_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_events_title_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_events_upcoming")
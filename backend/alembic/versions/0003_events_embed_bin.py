@@ -0,0 +1,23 @@
+"""binary-quantized copy of events.embed for a coarse Hamming pre-filter"""
+from alembic import op
+
+revision = '0003_events_embed_bin'
+down_revision = '0002_events_read_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # 1 bit/dim (48 bytes/row vs 768 for halfvec); generated so it can never
+    # drift from embed
+    op.execute(
+        "ALTER TABLE events ADD COLUMN embed_bin bit(384) "
+        "GENERATED ALWAYS AS (binary_quantize(embed)::bit(384)) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_embed_bin "
+        "ON events USING hnsw (embed_bin bit_hamming_ops)"
+    )
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_events_embed_bin")
+    op.execute("ALTER TABLE events DROP COLUMN IF EXISTS embed_bin")
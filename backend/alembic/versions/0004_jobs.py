@@ -0,0 +1,23 @@
+"""jobs table for background ingestion runs"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0004_jobs'
+down_revision = '0003_events_embed_bin'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('kind', sa.Text(), nullable=False),
+        sa.Column('status', sa.Text(), nullable=False, server_default='queued'),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('result', sa.dialects.postgresql.JSONB(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+    )
+
+def downgrade():
+    op.drop_table('jobs')
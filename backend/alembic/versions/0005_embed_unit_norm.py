@@ -0,0 +1,23 @@
+"""embeddings are stored unit-length (or all-zero for empty text)"""
+from alembic import op
+
+revision = '0005_embed_unit_norm'
+down_revision = '0004_jobs'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # NOT VALID: enforced for every new write; run VALIDATE CONSTRAINT once
+    # legacy rows have been re-embedded
+    op.execute(
+        "ALTER TABLE events ADD CONSTRAINT ck_events_embed_unit "
+        "CHECK (embed IS NULL OR vector_norm(embed) = 0 OR vector_norm(embed) BETWEEN 0.99 AND 1.01) NOT VALID"
+    )
+    op.execute(
+        "ALTER TABLE users ADD CONSTRAINT ck_users_embed_unit "
+        "CHECK (embed IS NULL OR vector_norm(embed) = 0 OR vector_norm(embed) BETWEEN 0.99 AND 1.01) NOT VALID"
+    )
+
+def downgrade():
+    op.execute("ALTER TABLE users DROP CONSTRAINT IF EXISTS ck_users_embed_unit")
+    op.execute("ALTER TABLE events DROP CONSTRAINT IF EXISTS ck_events_embed_unit")
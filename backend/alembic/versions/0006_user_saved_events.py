@@ -0,0 +1,25 @@
+"""user_saved_events with a unique (user_id, event_id) for upsert-style saves"""
+from alembic import op
+
+revision = '0006_user_saved_events'
+down_revision = '0005_embed_unit_norm'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # the table may already exist in older databases; only add what's missing
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS user_saved_events (
+            id bigserial PRIMARY KEY,
+            user_id uuid NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            event_id uuid NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+            saved_at timestamptz NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_user_saved_events_user_event "
+        "ON user_saved_events (user_id, event_id)"
+    )
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ux_user_saved_events_user_event")
@@ -0,0 +1,23 @@
+"""saved-events join indexes, built without blocking writes"""
+from alembic import op
+
+revision = '0007_user_saved_events_indexes'
+down_revision = '0006_user_saved_events'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # /user/saved-events filters on user_id and joins on event_id: the
+    # (user_id, event_id) unique index from 0006 serves that as an
+    # index-only scan, and ix_events_upcoming (0002) leads with start_time.
+    # What's missing is the reverse side: deleting an event cascades into
+    # user_saved_events by event_id.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_saved_events_event "
+            "ON user_saved_events (event_id)"
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_user_saved_events_event")
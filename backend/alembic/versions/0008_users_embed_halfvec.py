@@ -0,0 +1,24 @@
+"""store user profile embeddings as halfvec, like events.embed"""
+from alembic import op
+
+revision = '0008_users_embed_halfvec'
+down_revision = '0007_user_saved_events_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # vector_norm() is vector-only; the unit-norm check moves to l2_norm()
+    op.execute("ALTER TABLE users DROP CONSTRAINT IF EXISTS ck_users_embed_unit")
+    op.execute("ALTER TABLE users ALTER COLUMN embed TYPE halfvec(384) USING embed::halfvec(384)")
+    op.execute(
+        "ALTER TABLE users ADD CONSTRAINT ck_users_embed_unit "
+        "CHECK (embed IS NULL OR l2_norm(embed) = 0 OR l2_norm(embed) BETWEEN 0.99 AND 1.01) NOT VALID"
+    )
+
+def downgrade():
+    op.execute("ALTER TABLE users DROP CONSTRAINT IF EXISTS ck_users_embed_unit")
+    op.execute("ALTER TABLE users ALTER COLUMN embed TYPE vector(384) USING embed::vector(384)")
+    op.execute(
+        "ALTER TABLE users ADD CONSTRAINT ck_users_embed_unit "
+        "CHECK (embed IS NULL OR vector_norm(embed) = 0 OR vector_norm(embed) BETWEEN 0.99 AND 1.01) NOT VALID"
+    )
@@ -0,0 +1,20 @@
+"""per-feed ETag/Last-Modified for conditional GETs"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0009_scraper_state'
+down_revision = '0008_users_embed_halfvec'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'scraper_state',
+        sa.Column('source', sa.Text(), primary_key=True),
+        sa.Column('etag', sa.Text(), nullable=True),
+        sa.Column('last_modified', sa.Text(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+    )
+
+def downgrade():
+    op.drop_table('scraper_state')
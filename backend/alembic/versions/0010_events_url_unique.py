@@ -0,0 +1,32 @@
+"""unique CampusLabs event links so the RSS scraper can upsert with ON CONFLICT (url)"""
+from alembic import op
+
+revision = '0010_events_url_unique'
+down_revision = '0009_scraper_state'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # only per-event links are unique: other scrapers reuse one url (a club or
+    # department page) for many events, so those rows are left alone.
+    # Earlier scrapes could store the same event link twice; keep it on the
+    # oldest row and clear it on the rest (rows aren't deleted, since saved
+    # events cascade from them)
+    op.execute("""
+        UPDATE events e SET url = NULL
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY url ORDER BY created_at, id) AS rn
+            FROM events
+            WHERE url LIKE 'https://gatech.campuslabs.com/engage/event/%'
+        ) d
+        WHERE e.id = d.id AND d.rn > 1
+    """)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_events_url "
+            "ON events (url) WHERE url LIKE 'https://gatech.campuslabs.com/engage/event/%'"
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ux_events_url")
@@ -0,0 +1,14 @@
+"""server-side default for events.id so bulk inserts can omit it"""
+from alembic import op
+
+revision = '0011_events_id_default'
+down_revision = '0010_events_url_unique'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # gen_random_uuid() is built in from Postgres 13
+    op.execute("ALTER TABLE events ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+def downgrade():
+    op.execute("ALTER TABLE events ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,62 @@
+"""store events.embed as halfvec and index it with HNSW instead of ivfflat"""
+from alembic import op
+
+revision = '0012_events_embed_halfvec'
+down_revision = '0011_events_id_default'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # everything that depends on embed's type goes first: the ivfflat index,
+    # the vector_norm() check and the generated embed_bin column
+    op.execute("ALTER TABLE events DROP CONSTRAINT IF EXISTS ck_events_embed_unit")
+    op.execute("DROP INDEX IF EXISTS ix_events_embed")
+    op.execute("DROP INDEX IF EXISTS ix_events_embed_bin")
+    op.execute("ALTER TABLE events DROP COLUMN IF EXISTS embed_bin")
+
+    op.execute("ALTER TABLE events ALTER COLUMN embed TYPE halfvec(384) USING embed::halfvec(384)")
+
+    op.execute(
+        "ALTER TABLE events ADD COLUMN embed_bin bit(384) "
+        "GENERATED ALWAYS AS (binary_quantize(embed)::bit(384)) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_embed_bin "
+        "ON events USING hnsw (embed_bin bit_hamming_ops)"
+    )
+    # HNSW over half-precision vectors: better recall/QPS than ivfflat and
+    # half the bytes touched per distance computation
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_embed "
+        "ON events USING hnsw (embed halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)"
+    )
+    # vector_norm() is vector-only; the unit-norm check moves to l2_norm()
+    op.execute(
+        "ALTER TABLE events ADD CONSTRAINT ck_events_embed_unit "
+        "CHECK (embed IS NULL OR l2_norm(embed) = 0 OR l2_norm(embed) BETWEEN 0.99 AND 1.01) NOT VALID"
+    )
+
+def downgrade():
+    op.execute("ALTER TABLE events DROP CONSTRAINT IF EXISTS ck_events_embed_unit")
+    op.execute("DROP INDEX IF EXISTS ix_events_embed")
+    op.execute("DROP INDEX IF EXISTS ix_events_embed_bin")
+    op.execute("ALTER TABLE events DROP COLUMN IF EXISTS embed_bin")
+
+    op.execute("ALTER TABLE events ALTER COLUMN embed TYPE vector(384) USING embed::vector(384)")
+
+    op.execute(
+        "ALTER TABLE events ADD COLUMN embed_bin bit(384) "
+        "GENERATED ALWAYS AS (binary_quantize(embed)::bit(384)) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_embed_bin "
+        "ON events USING hnsw (embed_bin bit_hamming_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_embed "
+        "ON events USING ivfflat (embed vector_cosine_ops) WITH (lists = 100)"
+    )
+    op.execute(
+        "ALTER TABLE events ADD CONSTRAINT ck_events_embed_unit "
+        "CHECK (embed IS NULL OR vector_norm(embed) = 0 OR vector_norm(embed) BETWEEN 0.99 AND 1.01) NOT VALID"
+    )
@@ -1,26 +1,36 @@
 from __future__ import annotations
-from typing import Iterable
+from typing import Any, Iterable, Mapping
+from collections import OrderedDict
 from functools import lru_cache
+from threading import Lock
 import re
 
+import xxhash
+
 _STOP = {
     "a","an","the","and","or","but","if","then","else","for","of","on","in","with","to","from",
     "at","by","about","is","are","be","this","that","it","as","you","your","our","we","they"
 }
 _WORD = re.compile(r"[A-Za-z0-9]+")
+_SENT_RE = re.compile(r"[.!?]\s")
 
 class LLM:
     def summarize(self, text: str, max_words: int = 22) -> str: ...
     def why_reason(self, user_interests: list[str] | None, title: str, description: str | None, tags: list[str] | None) -> str: ...
     def zero_shot(self, text: str, labels: Iterable[str]) -> list[str]: ...
 
+    def why_reason_batch(self, user_interests: list[str] | None, rows: Iterable[Mapping[str, Any]]) -> list[str]:
+        return [self.why_reason(user_interests, r.get("title"), r.get("description"), r.get("tags")) for r in rows]
+
 class LocalProvider(LLM):
     def summarize(self, text: str, max_words: int = 22) -> str:
         t = (text or "").strip()
         if not t:
             return ""
-        s = re.split(r"(?<=[.!?])\s+", t)[0]
-        words = s.split()
+        # first sentence: look only as far as needed (and never past 2000 chars)
+        m = _SENT_RE.search(t, 0, 2000)
+        s = t[:m.start() + 1] if m else t
+        words = s.split(None, max_words)
         if len(words) > max_words:
             s = " ".join(words[:max_words]) + "…"
         return s
@@ -31,22 +41,26 @@ class LocalProvider(LLM):
         text = f"{title or ''} {description or ''}".lower()
         kws = {w for w in _WORD.findall(text) if w not in _STOP and len(w) > 2}
         hits = [i for i in user_interests if any(i in w or w in i for w in kws)]
-        tag_hits = [t for t in tags if t and t.lower() in kws]
+        return _compose_reason(hits, tags, kws)
 
-        reasons = []
-        if hits:
-            reasons.append(f"matches your interests: {', '.join(sorted(set(hits))[:3])}")
-        if tag_hits:
-            reasons.append(f"tagged {', '.join(sorted(set(tag_hits))[:3])}")
-        if "free" in kws:
-            reasons.append("free to attend")
-        if "career" in kws or "internship" in kws:
-            reasons.append("career-focused")
-        if not reasons:
-            reasons.append("popular and coming up soon")
-        out = " • ".join(reasons[:2])
-        if out and out[0].islower(): out = out[0].upper() + out[1:]
-        return out
+    def why_reason_batch(self, user_interests, rows):
+        rows = list(rows)
+        user_interests = [i.lower() for i in (user_interests or [])]
+        kw_rows = [
+            {w for w in _WORD.findall(f"{r.get('title') or ''} {r.get('description') or ''}".lower())
+             if w not in _STOP and len(w) > 2}
+            for r in rows
+        ]
+        # interest/keyword substring tests once per distinct word across the
+        # whole batch, instead of once per word per row
+        word_hits = {}
+        if user_interests:
+            for w in set().union(*kw_rows):
+                word_hits[w] = [i for i in user_interests if i in w or w in i]
+        return [
+            _compose_reason([i for w in kws for i in word_hits.get(w, ())], r.get("tags") or [], kws)
+            for r, kws in zip(rows, kw_rows)
+        ]
 
     def zero_shot(self, text: str, labels: Iterable[str]) -> list[str]:
         text = (text or "").lower()
@@ -57,10 +71,50 @@ class LocalProvider(LLM):
                 out.append(lb)
         return out
 
+def _compose_reason(hits: list[str], tags: list[str], kws: set[str]) -> str:
+    tag_hits = [t for t in tags if t and t.lower() in kws]
+
+    reasons = []
+    if hits:
+        reasons.append(f"matches your interests: {', '.join(sorted(set(hits))[:3])}")
+    if tag_hits:
+        reasons.append(f"tagged {', '.join(sorted(set(tag_hits))[:3])}")
+    if "free" in kws:
+        reasons.append("free to attend")
+    if "career" in kws or "internship" in kws:
+        reasons.append("career-focused")
+    if not reasons:
+        reasons.append("popular and coming up soon")
+    out = " • ".join(reasons[:2])
+    if out and out[0].islower(): out = out[0].upper() + out[1:]
+    return out
+
 @lru_cache(maxsize=1)
 def get_provider() -> LLM:
     return LocalProvider()
 
-@lru_cache(maxsize=5000)
-def cached_summary(cache_key: str, text: str, max_words: int = 22) -> str:
-    return LocalProvider().summarize(text, max_words=max_words)
+_SUMMARY_CACHE_MAX = 5000
+_summary_cache: OrderedDict[tuple[int, int], str] = OrderedDict()
+_summary_lock = Lock()
+
+def summary_cached(text: str, max_words: int = 22) -> bool:
+    return (xxhash.xxh3_64_intdigest((text or "").encode()), max_words) in _summary_cache
+
+def cached_summary(text: str, max_words: int = 22) -> str:
+    """Summary memoized on a 64-bit content fingerprint (bounded LRU).
+
+    Keying on the content hash keeps the key small and means an edited
+    description never returns a stale summary.
+    """
+    key = (xxhash.xxh3_64_intdigest((text or "").encode()), max_words)
+    with _summary_lock:
+        s = _summary_cache.get(key)
+        if s is not None:
+            _summary_cache.move_to_end(key)
+            return s
+    s = get_provider().summarize(text, max_words=max_words)
+    with _summary_lock:
+        _summary_cache[key] = s
+        if len(_summary_cache) > _SUMMARY_CACHE_MAX:
+            _summary_cache.popitem(last=False)
+    return s
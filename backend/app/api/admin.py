@@ -1,42 +1,41 @@
 from __future__ import annotations
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from ..db import SessionLocal
+from ..db import get_db
 from ..models.event import Event
 from ..models.user import User
-from ..recs.embeddings import embed_text
-from sqlalchemy import text
+from ..recs.embeddings import embed_texts
+from sqlalchemy import select, text, update
 from datetime import datetime, timezone
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/reindex")
 def reindex(db: Session = Depends(get_db)):
-    updated_events = 0
-    updated_users = 0
-
-    evs = db.query(Event).filter(Event.embed == None).limit(5000).all()  # noqa: E711
-    for e in evs:
-        txt = f"{e.title or ''} {e.description or ''}".strip()
-        e.embed = embed_text(txt).tolist()
-        updated_events += 1
+    evs = db.execute(
+        select(Event.id, Event.title, Event.description)
+        .where(Event.embed.is_(None))
+        .limit(5000)
+    ).all()
+    ev_vecs = embed_texts([f"{e.title or ''} {e.description or ''}".strip() for e in evs])
+    if evs:
+        # one executemany UPDATE keyed on the PK instead of a flush per dirty row
+        db.execute(update(Event), [{"id": e.id, "embed": v.tolist()} for e, v in zip(evs, ev_vecs)])
 
-    us = db.query(User).filter(User.embed == None).limit(5000).all()  # noqa: E711
+    us = db.execute(
+        select(User.id, User.interests)
+        .where(User.embed.is_(None))
+        .limit(5000)
+    ).all()
+    texts = []
     for u in us:
         ints = u.interests or []
-        txt = " ".join(ints) if isinstance(ints, list) else str(ints)
-        u.embed = embed_text(txt).tolist()
-        updated_users += 1
+        texts.append(" ".join(ints) if isinstance(ints, list) else str(ints))
+    us_vecs = embed_texts(texts)
+    if us:
+        db.execute(update(User), [{"id": u.id, "embed": v.tolist()} for u, v in zip(us, us_vecs)])
 
-    db.commit()
-    return {"events": updated_events, "users": updated_users}
+    return {"events": len(evs), "users": len(us)}
     
 @router.get("/metrics")
 def metrics(db: Session = Depends(get_db)):
@@ -56,4 +55,4 @@ def metrics(db: Session = Depends(get_db)):
         saves  = int(rows.saves or 0)
         rsvps  = int(rows.rsvps or 0)
     return {"window": "last_24h", "clicks": clicks, "saves": saves, "rsvps": rsvps,
-            "interactions": clicks + saves + rsvps}
\ No newline at end of file
+            "interactions": clicks + saves + rsvps}
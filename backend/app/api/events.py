@@ -1,152 +1,163 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Sequence
+import asyncio
+import json
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # DB session dep (supports either module name)
 try:
-    from ..db import get_db  # type: ignore
+    from ..db import get_async_db  # type: ignore
 except Exception:  # pragma: no cover
-    from ..database import get_db  # type: ignore
+    from ..database import get_async_db  # type: ignore
 
 # Lightweight “AI” helpers you already added
-from ..ai.providers import get_provider, cached_summary
+from ..ai.providers import get_provider, cached_summary, summary_cached
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+_PROVIDER = get_provider()
 
-# --------------------------- helpers ---------------------------
 
-def _now() -> datetime:
-    return datetime.now(timezone.utc)
+# --------------------------- helpers ---------------------------
 
-def _kwset(s: str) -> set[str]:
-    import re
-    stop = {
-        "a","an","the","and","or","but","if","then","else","for","of","on","in","with",
-        "to","from","at","by","about","is","are","be","this","that","it","as","you",
-        "your","our","we","they","will","their","there","here"
-    }
-    words = set(w.lower() for w in re.findall(r"[A-Za-z0-9]+", s or ""))
-    return {w for w in words if len(w) > 2 and w not in stop}
-
-def _interest_score(user_interests: List[str], title: str, desc: str, tags: List[str]) -> float:
-    if not user_interests:
-        return 0.0
-    text_kws = _kwset(f"{title} {desc}")
-    score = 0.0
-    for i in user_interests:
-        i2 = i.lower().strip()
-        if not i2:
-            continue
-        if i2 in text_kws:
-            score += 1.0
-        if any(i2 in (t or "").lower() for t in tags or []):
-            score += 0.75
-    return min(score, 3.0)
-
-def _recency_boost(start_time: datetime) -> float:
-    # Sooner = higher. 0–2 range.
-    import math
-    dt_days = (start_time - _now()).total_seconds() / 86400.0
-    # events far in future get little boost; this week gets most
-    return max(0.0, 2.0 * math.exp(-max(dt_days, 0.0) / 7.0))
-
-def _jaccard(a: set[str], b: set[str]) -> float:
-    if not a or not b:
-        return 0.0
-    inter = len(a & b)
-    if inter == 0:
-        return 0.0
-    return inter / float(len(a | b))
+_STOP = frozenset({
+    "a","an","the","and","or","but","if","then","else","for","of","on","in","with",
+    "to","from","at","by","about","is","are","be","this","that","it","as","you",
+    "your","our","we","they","will","their","there","here"
+})
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+
+@lru_cache(maxsize=5000)
+def _kwset(s: str) -> frozenset[str]:
+    # cached per text: /similar re-tokenizes the same candidate rows every call
+    return frozenset(
+        w for w in (m.group(0).lower() for m in _WORD_RE.finditer(s or ""))
+        if len(w) > 2 and w not in _STOP
+    )
+
+# token sets as fixed-width hashed bitsets (4096 bits = 512 bytes per row), so
+# Jaccard over a whole candidate pool is a couple of vectorized AND/OR + popcounts.
+# hash() is per-process salted, which is fine: bitsets never leave the process.
+_NBITS = 4096
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+def _bitrows(sets: Sequence[Iterable[str]]) -> np.ndarray:
+    m = np.zeros((len(sets), _NBITS), dtype=bool)
+    for r, ws in enumerate(sets):
+        m[r, [hash(w) & (_NBITS - 1) for w in ws]] = True
+    return np.packbits(m, axis=1)
+
+def _jaccard_many(base: np.ndarray, cand: np.ndarray) -> np.ndarray:
+    """Jaccard of one bitset row against each row of cand (0 when either side is empty)."""
+    inter = _POPCOUNT[cand & base].sum(axis=1)
+    union = _POPCOUNT[cand | base].sum(axis=1)
+    return np.divide(inter, union, out=np.zeros(len(cand)), where=union > 0)
 
 def _row_to_event_dict(r: Dict[str, Any]) -> Dict[str, Any]:
     return {
-        "id": str(r["id"]),
+        "id": r["id"],
         "title": r.get("title") or "",
-        "start_time": r["start_time"].isoformat() if isinstance(r.get("start_time"), datetime) else r.get("start_time"),
+        "start_time": r.get("start_time"),
         "location": r.get("location"),
         "tags": r.get("tags") or [],
         "url": r.get("url"),
     }
 
 
-def _load_user_interests(db: Session, user_id: str | None) -> List[str]:
+def _to_vec(v) -> np.ndarray | None:
+    # embeddings are normalized at write time; only the all-zero "no text" vector is skipped
+    if v is None:
+        return None
+    a = np.asarray(v, dtype=np.float32)
+    return a if a.any() else None
+
+
+async def _load_user_interests(db: AsyncSession, user_id: str | None) -> List[str]:
     if not user_id:
         return []
-    row = db.execute(text("SELECT interests FROM users WHERE id=:id"), {"id": user_id}).first()
+    row = (await db.execute(text("SELECT interests FROM users WHERE id=:id"), {"id": user_id})).first()
     interests = list(row[0]) if row and isinstance(row[0], list) else []
     return [str(x) for x in interests]
 
 
-def _fetch_upcoming(db: Session, limit: int = 200) -> List[Dict[str, Any]]:
-    bind = db.get_bind()
-    with bind.connect() as conn:
-        rows = conn.execute(
-            text("""
-                SELECT id, title, description, start_time, location, tags, url
-                FROM events
-                WHERE start_time > NOW()
-                ORDER BY start_time ASC
-                LIMIT :lim
-            """),
-            {"lim": limit},
-        ).mappings().all()
-        return [dict(r) for r in rows]
+async def _load_user(db: AsyncSession, user_id: str | None) -> Tuple[List[str], np.ndarray | None]:
+    """Interests and unit-norm profile vector (None if the user has no embedding)."""
+    if not user_id:
+        return [], None
+    row = (await db.execute(text("SELECT interests, embed::vector FROM users WHERE id=:id"), {"id": user_id})).first()
+    if not row:
+        return [], None
+    interests = list(row[0]) if isinstance(row[0], list) else []
+    return [str(x) for x in interests], _to_vec(row[1])
+
+
+async def _summaries(texts: List[str]) -> List[str]:
+    # summarize cache misses concurrently off the event loop; hits are dict lookups
+    missing = [t for t in set(texts) if not summary_cached(t)]
+    if missing:
+        await asyncio.gather(*(asyncio.to_thread(cached_summary, t) for t in missing))
+    return [cached_summary(t) for t in texts]
 
 
 # --------------------------- endpoints ---------------------------
 
 @router.get("/feed")
-def feed(
+async def feed(
     user_id: str | None = None,
     limit: int = Query(20, ge=1, le=100),
     page: int = Query(1, ge=1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Personalized feed with pagination (simple interest + recency scoring)."""
-    prov = get_provider()
-    interests = _load_user_interests(db, user_id)
-    rows = _fetch_upcoming(db, limit=1000)  # Get more events for better pagination
-
-    scored: List[Dict[str, Any]] = []
-    for r in rows:
-        title = r.get("title") or ""
-        desc = r.get("description") or ""
-        tags = r.get("tags") or []
-        start_time = r.get("start_time")
-        if not isinstance(start_time, datetime):
-            continue
-
-        s_interest = _interest_score(interests, title, desc, tags)
-        s_when = _recency_boost(start_time)
-        score = s_interest + s_when
-
-        ck = f'{r["id"]}:{len(desc)}'
-        item = _row_to_event_dict(r)
-        item.update({
-            "score": round(score, 6),
-            "summary": cached_summary(ck, f"{title}. {desc}", max_words=22),
-            "why": prov.why_reason(interests, title, desc, tags),
-        })
-        scored.append(item)
+    """Personalized feed with pagination (embedding similarity + recency, scored in SQL)."""
+    interests, uvec = await _load_user(db, user_id)
+
+    # cosine similarity to the user's profile (0 without one) plus a 0–2
+    # recency boost that decays with a one-week time constant
+    # the page comes back as one jsonb array already in response shape, so
+    # rows are decoded in C instead of mapped one by one in Python
+    page_json, total = (await db.execute(
+        text("""
+            SELECT COALESCE(jsonb_agg(to_jsonb(e) - 'total' ORDER BY e.score DESC), '[]'), MAX(e.total)
+            FROM (
+                SELECT id::text AS id, COALESCE(title, '') AS title, description, start_time,
+                       location, COALESCE(tags, '{}') AS tags, url,
+                       COALESCE(1 - (embed <=> :uv), 0)
+                         + 2 * exp(-GREATEST(EXTRACT(EPOCH FROM (start_time - NOW())) / 604800.0, 0)) AS score,
+                       COUNT(*) OVER () AS total
+                FROM events
+                WHERE start_time > NOW()
+                ORDER BY score DESC
+                LIMIT :lim OFFSET :off
+            ) e
+        """),
+        {"uv": uvec, "lim": limit, "off": (page - 1) * limit},
+    )).one()
+    rows = json.loads(page_json)
+
+    summaries = await _summaries([f"{r['title']}. {r.get('description') or ''}" for r in rows])
+    whys = _PROVIDER.why_reason_batch(interests, rows)
+    for r, summary, why in zip(rows, summaries, whys):
+        del r["description"]
+        r["score"] = round(float(r["score"]), 6)
+        r["summary"] = summary
+        r["why"] = why
 
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    
     # Calculate pagination
-    total_events = len(scored)
+    if total is not None:
+        total_events = int(total)
+    else:
+        total_events = (await db.execute(text("SELECT COUNT(*) FROM events WHERE start_time > NOW()"))).scalar() or 0
     total_pages = (total_events + limit - 1) // limit
-    start_idx = (page - 1) * limit
-    end_idx = start_idx + limit
-    
-    events_page = scored[start_idx:end_idx]
-    
+
     return {
-        "events": events_page,
+        "events": rows,
         "pagination": {
             "current_page": page,
             "total_pages": total_pages,
@@ -159,129 +170,153 @@ def feed(
 
 
 @router.get("/search")
-def search(
+async def search(
     q: str,
     limit: int = Query(20, ge=1, le=100),
     user_id: str | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Keyword search (title/description ILIKE) with summaries/why."""
-    prov = get_provider()
-    interests = _load_user_interests(db, user_id)
-
-    bind = db.get_bind()
-    with bind.connect() as conn:
-        rows = conn.execute(
-            text("""
-                SELECT id, title, description, start_time, location, tags, url
+    interests = await _load_user_interests(db, user_id)
+
+    rows = json.loads((await db.execute(
+        text("""
+            SELECT COALESCE(jsonb_agg(to_jsonb(e) ORDER BY e.start_time), '[]')
+            FROM (
+                SELECT id::text AS id, COALESCE(title, '') AS title, description, start_time,
+                       location, COALESCE(tags, '{}') AS tags, url
                 FROM events
                 WHERE start_time > NOW()
                   AND (title ILIKE :p OR description ILIKE :p)
                 ORDER BY start_time ASC
                 LIMIT :lim
-            """),
-            {"p": f"%{q}%", "lim": limit},
-        ).mappings().all()
-
-    out: List[Dict[str, Any]] = []
-    for r in rows:
-        title = r.get("title") or ""
-        desc = r.get("description") or ""
-        tags = r.get("tags") or []
-        ck = f'{r["id"]}:{len(desc)}'
-
-        item = _row_to_event_dict(r)
-        item.update({
-            "score": 0.0,
-            "summary": cached_summary(ck, f"{title}. {desc}", max_words=22),
-            "why": prov.why_reason(interests, title, desc, tags),
-        })
-        out.append(item)
-    return out
-
+            ) e
+        """),
+        {"p": f"%{q}%", "lim": limit},
+    )).scalar_one())
+
+    summaries = await _summaries([f"{r['title']}. {r.get('description') or ''}" for r in rows])
+    whys = _PROVIDER.why_reason_batch(interests, rows)
+    for r, summary, why in zip(rows, summaries, whys):
+        del r["description"]
+        r["score"] = 0.0
+        r["summary"] = summary
+        r["why"] = why
+    return rows
 
 @router.get("/{event_id}")
-def get_event(event_id: str, db: Session = Depends(get_db)):
-    bind = db.get_bind()
-    with bind.connect() as conn:
-        r = conn.execute(
-            text("""
-                SELECT id, title, description, start_time, location, tags, url
-                FROM events WHERE id = :id
-            """),
-            {"id": event_id},
-        ).mappings().first()
+async def get_event(event_id: str, db: AsyncSession = Depends(get_async_db)):
+    r = (await db.execute(
+        text("""
+            SELECT id, title, description, start_time, location, tags, url
+            FROM events WHERE id = :id
+        """),
+        {"id": event_id},
+    )).mappings().first()
 
     if not r:
         raise HTTPException(status_code=404, detail="not found")
 
+    # UUID/datetime go straight to the (orjson) response encoder
     return {
-        "id": str(r["id"]),
+        "id": r["id"],
         "title": r.get("title"),
         "description": r.get("description"),
-        "start_time": r.get("start_time").isoformat() if isinstance(r.get("start_time"), datetime) else r.get("start_time"),
+        "start_time": r.get("start_time"),
         "location": r.get("location"),
         "tags": r.get("tags") or [],
         "url": r.get("url"),
     }
 
 
+# coarse pass: Hamming distance on embed_bin (48 bytes/row) picks the pool,
+# then only those rows are compared by exact cosine on embed
+_RERANK_POOL = 200
+_SIMILAR_SQL = text("""
+    WITH cand AS (
+        SELECT id
+        FROM events
+        WHERE start_time > NOW() AND id <> :id AND embed_bin IS NOT NULL
+        ORDER BY embed_bin <~> (SELECT embed_bin FROM events WHERE id=:id)
+        LIMIT :n_cand
+    )
+    SELECT e2.id, e2.title, e2.description, e2.start_time, e2.location, e2.tags, e2.url,
+           1 - (e2.embed <=> (SELECT embed FROM events WHERE id=:id)) AS score,
+           (SELECT tags FROM events WHERE id=:id) AS base_tags
+    FROM events e2 JOIN cand USING (id)
+    ORDER BY e2.embed <=> (SELECT embed FROM events WHERE id=:id)
+    LIMIT :lim
+""")
+
 @router.get("/{event_id}/similar")
-def similar(
+async def similar(
     event_id: str,
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
-    Similar events (semantic-lite):
-      - start from the target event
-      - compute token overlap + tag overlap
+    Similar events:
+      - Hamming pre-filter on the 1-bit embed_bin index picks a candidate pool,
+        which is reranked by exact (halfvec) cosine to the target's embedding
+      - if the event has no embedding: token overlap + tag overlap
       - return top-N upcoming
-    If you later wire real vector similarity, swap the scoring block.
     """
-    bind = db.get_bind()
-    with bind.connect() as conn:
-        base = conn.execute(
-            text("SELECT id, title, description, start_time, location, tags, url FROM events WHERE id=:id"),
-            {"id": event_id},
-        ).mappings().first()
-        if not base:
-            raise HTTPException(404, "not found")
-
-        # candidate pool: upcoming events (exclude self), grab a decent window
-        rows = conn.execute(
-            text("""
-                SELECT id, title, description, start_time, location, tags, url
-                FROM events
-                WHERE start_time > NOW() AND id <> :id
-                ORDER BY start_time ASC
-                LIMIT 400
-            """),
-            {"id": event_id},
-        ).mappings().all()
-
-    base_kw = _kwset(f"{base.get('title') or ''} {base.get('description') or ''}")
-    base_tags = set((base.get("tags") or []))
-
-    prov = get_provider()
+    n_cand = max(_RERANK_POOL, limit * 4)
+    # the HNSW scan has to yield the whole pool (start_time is filtered after
+    # it), so ef_search stays well above pgvector's default of 40
+    await db.execute(text(f"SET LOCAL hnsw.ef_search = {n_cand}"))
+    rows = (await db.execute(_SIMILAR_SQL, {"id": event_id, "n_cand": n_cand, "lim": limit})).mappings().all()
+
+    if rows and rows[0]["score"] is not None:
+        base_tags = list(rows[0]["base_tags"] or [])
+        top = [(float(r["score"]), r) for r in rows]
+    else:
+        base_tags, top = await _similar_by_tokens(db, event_id, limit)
+
+    # summaries/why only for the rows we return
+    summaries = await _summaries([f"{r.get('title') or ''}. {r.get('description') or ''}" for _, r in top])
+    whys = _PROVIDER.why_reason_batch(base_tags, [r for _, r in top])
     out: List[Dict[str, Any]] = []
-    for r in rows:
-        title = r.get("title") or ""
-        desc = r.get("description") or ""
-        tags = r.get("tags") or []
-        kw = _kwset(f"{title} {desc}")
-        tag_overlap = _jaccard(base_tags, set(tags))
-        text_overlap = _jaccard(base_kw, kw)
-        score = 0.6 * text_overlap + 0.4 * tag_overlap
-
-        ck = f'{r["id"]}:{len(desc)}'
+    for (score, r), summary, why in zip(top, summaries, whys):
         item = _row_to_event_dict(r)
         item.update({
             "score": round(score, 6),
-            "summary": cached_summary(ck, f"{title}. {desc}", max_words=22),
-            "why": prov.why_reason(list(base_tags), title, desc, tags),
+            "summary": summary,
+            "why": why,
         })
         out.append(item)
+    return out
+
+
+async def _similar_by_tokens(
+    db: AsyncSession, event_id: str, limit: int
+) -> Tuple[List[str], List[Tuple[float, Dict[str, Any]]]]:
+    """Keyword/tag Jaccard over the next 400 upcoming events (events without an embedding)."""
+    base = (await db.execute(
+        text("SELECT id, title, description, tags FROM events WHERE id=:id"),
+        {"id": event_id},
+    )).mappings().first()
+    if not base:
+        raise HTTPException(404, "not found")
+
+    rows = (await db.execute(
+        text("""
+            SELECT id, title, description, start_time, location, tags, url
+            FROM events
+            WHERE start_time > NOW() AND id <> :id
+            ORDER BY start_time ASC
+            LIMIT 400
+        """),
+        {"id": event_id},
+    )).mappings().all()
+
+    base_tags = list(base.get("tags") or [])
+    tag_overlap = _jaccard_many(_bitrows([base_tags])[0], _bitrows([r.get("tags") or [] for r in rows]))
+    base_kw = _kwset(f"{base.get('title') or ''} {base.get('description') or ''}")
+    text_overlap = _jaccard_many(
+        _bitrows([base_kw])[0],
+        _bitrows([_kwset(f"{r.get('title') or ''} {r.get('description') or ''}") for r in rows]),
+    )
 
-    out.sort(key=lambda x: x["score"], reverse=True)
-    return out[:limit]
+    scores = 0.6 * text_overlap + 0.4 * tag_overlap
+    return base_tags, [(float(scores[i]), rows[i]) for i in np.argsort(-scores, kind="stable")[:limit]]
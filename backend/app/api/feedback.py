@@ -1,22 +1,15 @@
 from __future__ import annotations
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
+from sqlalchemy import bindparam, text
 from sqlalchemy.orm import Session
-from ..db import SessionLocal
-from ..models.feedback import Feedback
-from ..models.user import User
-from ..models.event import Event
+from pgvector.sqlalchemy import HALFVEC, Vector
+from ..db import get_db
+from ..recs.embeddings import DIM
 import numpy as np
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 class FeedbackIn(BaseModel):
     user_id: str
     event_id: str
@@ -25,38 +18,59 @@ class FeedbackIn(BaseModel):
     rsvp: bool | None = None
     dwell_seconds: int | None = None
 
+_INSERT_FEEDBACK = """
+    INSERT INTO feedback (user_id, event_id, clicked, saved, rsvp, dwell_seconds)
+    VALUES (:uid, :eid, :clicked, :saved, :rsvp, :dwell)
+"""
+# feedback insert + profile nudge in one statement (data-modifying CTE always runs)
+_INSERT_AND_NUDGE = text(f"""
+    WITH ins AS ({_INSERT_FEEDBACK} RETURNING 1)
+    UPDATE users SET embed = :v WHERE id = :uid
+""").bindparams(bindparam("v", type_=HALFVEC(DIM)))
+
 def _normalize(v: np.ndarray) -> np.ndarray:
     n = float(np.linalg.norm(v))
     return v if n == 0.0 else (v / n)
 
 @router.post("")
 def log_feedback(body: FeedbackIn, db: Session = Depends(get_db)):
-    # write row
-    rec = Feedback(
-        user_id=body.user_id,
-        event_id=body.event_id,
-        clicked=bool(body.clicked or False),
-        saved=bool(body.saved or False),
-        rsvp=bool(body.rsvp or False),
-        dwell_seconds=int(body.dwell_seconds or 0),
-    )
-    db.add(rec)
+    params = {
+        "uid": body.user_id,
+        "eid": body.event_id,
+        "clicked": bool(body.clicked or False),
+        "saved": bool(body.saved or False),
+        "rsvp": bool(body.rsvp or False),
+        "dwell": int(body.dwell_seconds or 0),
+    }
 
     # if positive signal, nudge user profile toward the event embedding
+    newv = None
     positive = bool(body.clicked or body.saved or body.rsvp)
     if positive:
-        u = db.query(User).filter(User.id == body.user_id).first()
-        e = db.query(Event).filter(Event.id == body.event_id).first()
-        if u and e and e.embed is not None:
-            ev = np.array(e.embed, dtype=np.float32)
-            if u.embed is None:
-                newv = _normalize(ev)
+        # both embeddings in one round-trip, without loading full ORM rows
+        row = db.execute(
+            text("""
+                SELECT u.embed::vector AS uembed, e.embed::vector AS eembed
+                FROM users u JOIN events e ON TRUE
+                WHERE u.id = :uid AND e.id = :eid
+            """).columns(uembed=Vector(DIM), eembed=Vector(DIM)),
+            {"uid": body.user_id, "eid": body.event_id},
+        ).first()
+        if row and row.eembed is not None:
+            # stored embeddings are already unit length (see 0005 checks)
+            ev = np.asarray(row.eembed, dtype=np.float32)
+            if row.uembed is None:
+                newv = ev
             else:
-                uv = np.array(u.embed, dtype=np.float32)
+                uv = np.asarray(row.uembed, dtype=np.float32)
                 # EMA update; tweak alpha if you want faster adaptation
                 alpha = 0.9
                 newv = _normalize(alpha * uv + (1.0 - alpha) * ev)
-            u.embed = newv.tolist()
 
-    db.commit()
+    # write row (and the profile update, if any) in one round-trip
+    if newv is None:
+        db.execute(text(_INSERT_FEEDBACK), params)
+    else:
+        db.execute(_INSERT_AND_NUDGE, {**params, "v": newv.tolist()})
+
     return {}
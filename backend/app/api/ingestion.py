@@ -6,21 +6,35 @@ Provides endpoints for ingesting events from external sources like Georgia Tech
 
 import asyncio
 import logging
+import uuid
+from datetime import datetime, timezone
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
 from sqlalchemy.orm import Session
 
 # DB session dep
 try:
-    from ..db import get_db  # type: ignore
+    from ..db import get_db, SessionLocal  # type: ignore
 except Exception:  # pragma: no cover
-    from ..database import get_db  # type: ignore
+    from ..database import get_db, SessionLocal  # type: ignore
+from ..models import Job
 
 router = APIRouter(prefix="/ingestion", tags=["ingestion"])
 logger = logging.getLogger(__name__)
 
-async def _run_gatech_scraper():
-    """Run the Georgia Tech RSS event scraper"""
+def _set_job(job_id: uuid.UUID, **fields) -> None:
+    # sync session: callers on the event loop run it via asyncio.to_thread
+    with SessionLocal() as db:
+        job = db.get(Job, job_id)
+        if job is None:
+            return
+        for k, v in fields.items():
+            setattr(job, k, v)
+        db.commit()
+
+async def _run_gatech_scraper(job_id: uuid.UUID):
+    """Run the Georgia Tech RSS event scraper, recording progress on the job row"""
+    await asyncio.to_thread(_set_job, job_id, status="running", started_at=datetime.now(timezone.utc))
     try:
         import sys
         import os
@@ -32,66 +46,82 @@ async def _run_gatech_scraper():
         async with CampusLabsRSSScraper() as scraper:
             stored_count = await scraper.scrape_and_store_events()
         
-        return {
+        result = {
             "sample_events": 0,
             "scraped_events": stored_count,
             "total_events": stored_count
         }
+        await asyncio.to_thread(_set_job, job_id, status="done", finished_at=datetime.now(timezone.utc), result=result)
             
     except Exception as e:
         logger.error(f"Error running Georgia Tech RSS scraper: {e}")
-        raise
+        await asyncio.to_thread(_set_job, job_id, status="failed", finished_at=datetime.now(timezone.utc), result={"error": str(e)})
 
-@router.post("/gatech-events")
-async def ingest_gatech_events(
+@router.post("/gatech-events", status_code=202)
+def ingest_gatech_events(
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
-    Trigger ingestion of Georgia Tech events.
+    Queue ingestion of Georgia Tech events.
     
-    This endpoint will:
-    1. Create sample Georgia Tech events for testing
-    2. Attempt to scrape real events from Georgia Tech calendars
-    3. Store all events in the database
+    The scrape runs after the response is sent; poll
+    GET /ingestion/jobs/{job_id} for its status and counts.
     """
     try:
+        job = Job(kind="gatech-events", status="queued")
+        db.add(job)
+        db.commit()
+
         # Run the scraper in the background
-        result = await _run_gatech_scraper()
+        background_tasks.add_task(_run_gatech_scraper, job.id)
         
         return {
             "success": True,
-            "message": "Georgia Tech events ingestion completed",
-            "results": result
+            "status": "queued",
+            "job_id": str(job.id)
         }
         
     except Exception as e:
-        logger.error(f"Failed to ingest Georgia Tech events: {e}")
+        logger.error(f"Failed to queue Georgia Tech events ingestion: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to ingest events: {str(e)}"
         )
 
+@router.get("/jobs/{job_id}")
+def get_ingestion_job(job_id: uuid.UUID, db: Session = Depends(get_db)) -> Dict[str, Any]:
+    """Get the status and result of a background ingestion job"""
+    job = db.get(Job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "result": job.result,
+    }
+
 @router.get("/status")
 async def get_ingestion_status(db: Session = Depends(get_db)) -> Dict[str, Any]:
     """Get the current status of event ingestion"""
     try:
-        # Count total events in database
+        # One pass over events: total, Georgia Tech sourced, and upcoming counts
         from sqlalchemy import text
-        result = db.execute(text("SELECT COUNT(*) FROM events")).scalar()
-        total_events = result or 0
-        
-        # Count events with Georgia Tech URLs
-        gatech_result = db.execute(
-            text("SELECT COUNT(*) FROM events WHERE url LIKE '%gatech.edu%' OR host LIKE '%Georgia Tech%'")
-        ).scalar()
-        gatech_events = gatech_result or 0
-        
-        # Count upcoming events
-        upcoming_result = db.execute(
-            text("SELECT COUNT(*) FROM events WHERE start_time > NOW()")
-        ).scalar()
-        upcoming_events = upcoming_result or 0
+        row = db.execute(
+            text("""
+                SELECT
+                  COUNT(*) AS total,
+                  COUNT(*) FILTER (WHERE url LIKE '%gatech.edu%' OR host LIKE '%Georgia Tech%') AS gatech,
+                  COUNT(*) FILTER (WHERE start_time > NOW()) AS upcoming
+                FROM events
+            """)
+        ).first()
+        total_events = row.total or 0
+        gatech_events = row.gatech or 0
+        upcoming_events = row.upcoming or 0
         
         return {
             "total_events": total_events,
@@ -1,64 +1,121 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
-from pydantic import BaseModel
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+from pydantic import BaseModel, TypeAdapter
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import text
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from psycopg2 import errors
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # DB session dep (supports either module name)
 try:
-    from ..db import get_db  # type: ignore
+    from ..db import engine, get_db  # type: ignore
 except Exception:  # pragma: no cover
-    from ..database import get_db  # type: ignore
+    from ..database import engine, get_db  # type: ignore
+from ..cache import cache, incr_on_commit, saved_events_gen_key, saved_events_key
 
 router = APIRouter(prefix="/user", tags=["user"])
 
 
 class SaveEventRequest(BaseModel):
-    user_id: str
-    event_id: str
-
-
-def _row_to_event_dict(r) -> Dict[str, Any]:
-    """Convert a database row to event dictionary."""
-    return {
-        "id": str(r["id"]),
-        "title": r.get("title"),
-        "description": r.get("description"),
-        "start_time": r.get("start_time").isoformat() if r.get("start_time") else None,
-        "end_time": r.get("end_time").isoformat() if r.get("end_time") else None,
-        "timezone": r.get("timezone"),
-        "location": r.get("location"),
-        "host": r.get("host"),
-        "price_cents": r.get("price_cents"),
-        "url": r.get("url"),
-        "tags": r.get("tags") or [],
-        "raw_s3_uri": r.get("raw_s3_uri"),
-        "popularity": float(r.get("popularity") or 0),
-        "created_at": r.get("created_at").isoformat() if r.get("created_at") else None,
-    }
-
-
-@router.get("/saved-events")
+    user_id: uuid.UUID
+    event_id: uuid.UUID
+
+
+# compiled once; only the columns the response needs (no embed/embed_bin)
+_SAVED_EVENTS_SQL = text("""
+    SELECT e.id, e.title, e.description, e.start_time, e.end_time, e.timezone,
+           e.location, e.host, e.price_cents, e.url, COALESCE(e.tags, '{}') AS tags, e.raw_s3_uri,
+           COALESCE(e.popularity, 0) AS popularity, e.created_at
+    FROM events e
+    INNER JOIN user_saved_events use ON e.id = use.event_id
+    WHERE use.user_id = :user_id
+    ORDER BY e.start_time ASC
+""").bindparams(bindparam("user_id", type_=UUID(as_uuid=True)))
+
+# Postgres' default name for the user_id FK (0006); the other one is event_id's
+_USER_FK = "user_saved_events_user_id_fkey"
+
+# one round-trip: the FKs validate the user and event, the unique index dedupes
+_INSERT_SAVED_SQL = text("""
+    INSERT INTO user_saved_events (user_id, event_id, saved_at)
+    VALUES (:user_id, :event_id, NOW())
+    ON CONFLICT (user_id, event_id) DO NOTHING
+    RETURNING id
+""").bindparams(
+    bindparam("user_id", type_=UUID(as_uuid=True)),
+    bindparam("event_id", type_=UUID(as_uuid=True)),
+)
+
+_DELETE_SAVED_SQL = text("""
+    DELETE FROM user_saved_events
+    WHERE user_id = :user_id AND event_id = :event_id
+""").bindparams(
+    bindparam("user_id", type_=UUID(as_uuid=True)),
+    bindparam("event_id", type_=UUID(as_uuid=True)),
+)
+
+
+class SavedEvent(BaseModel):
+    id: uuid.UUID
+    title: str | None
+    description: str | None
+    start_time: datetime | None
+    end_time: datetime | None
+    timezone: str | None
+    location: str | None
+    host: str | None
+    price_cents: int | None
+    url: str | None
+    tags: List[str]
+    raw_s3_uri: str | None
+    popularity: float
+    created_at: datetime | None
+
+
+# validation + JSON encoding of the whole list happens in pydantic-core
+_SAVED_EVENTS = TypeAdapter(List[SavedEvent])
+
+
+def _stream_saved_events(user_id: uuid.UUID, gen: str) -> Iterator[bytes]:
+    """JSON array streamed 200 rows at a time; the assembled body is cached at the end."""
+    # own connection: the request's get_db session is closed before the body streams
+    chunks: List[bytes] = []
+    with engine.connect() as conn:
+        result = conn.execution_options(yield_per=200).execute(_SAVED_EVENTS_SQL, {"user_id": user_id})
+        for part in result.mappings().partitions():
+            body = _SAVED_EVENTS.dump_json(_SAVED_EVENTS.validate_python(part))[1:-1]
+            chunk = b"[" + body if not chunks else b"," + body
+            chunks.append(chunk)
+            yield chunk
+    tail = b"]" if chunks else b"[]"
+    chunks.append(tail)
+    yield tail
+    # a save/unsave that committed while this streamed has bumped the
+    # generation; the body may predate it, so don't cache it
+    if (cache.get(saved_events_gen_key(str(user_id))) or "0") == gen:
+        cache.set(saved_events_key(str(user_id), gen), b"".join(chunks), expire=300)
+
+
+@router.get("/saved-events", response_model=List[SavedEvent])
 def get_saved_events(
-    user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    user_id: uuid.UUID = Query(..., description="User ID"),
+) -> Response:
     """Get all saved events for a user, sorted chronologically."""
-    # Get saved events for the user
-    rows = db.execute(
-        text("""
-            SELECT e.* FROM events e
-            INNER JOIN user_saved_events use ON e.id = use.event_id
-            WHERE use.user_id = :user_id
-            ORDER BY e.start_time ASC
-        """),
-        {"user_id": user_id}
-    ).fetchall()
-    
-    return [_row_to_event_dict(r) for r in rows]
+    # cached as the serialized response body, per save/unsave generation;
+    # the generation is read before the SELECT runs
+    gen = cache.get(saved_events_gen_key(str(user_id))) or "0"
+    payload = cache.get(saved_events_key(str(user_id), gen))
+    if payload is not None:
+        return Response(content=payload, media_type="application/json")
+
+    return StreamingResponse(_stream_saved_events(user_id, gen), media_type="application/json")
 
 
 @router.post("/save-event")
@@ -67,57 +124,38 @@ def save_event(
     db: Session = Depends(get_db),
 ) -> Dict[str, Any]:
     """Save an event for a user."""
-    # Check if event exists
-    event_exists = db.execute(
-        text("SELECT id FROM events WHERE id = :event_id"),
-        {"event_id": request.event_id}
-    ).fetchone()
-    
-    if not event_exists:
-        raise HTTPException(status_code=404, detail="Event not found")
-    
-    # Check if already saved
-    already_saved = db.execute(
-        text("""
-            SELECT id FROM user_saved_events 
-            WHERE user_id = :user_id AND event_id = :event_id
-        """),
-        {"user_id": request.user_id, "event_id": request.event_id}
-    ).fetchone()
+    try:
+        inserted = db.execute(
+            _INSERT_SAVED_SQL,
+            {"user_id": request.user_id, "event_id": request.event_id}
+        ).fetchone()
+    except IntegrityError as e:
+        db.rollback()
+        if isinstance(e.orig, errors.ForeignKeyViolation):
+            if e.orig.diag.constraint_name == _USER_FK:
+                raise HTTPException(status_code=404, detail="User not found")
+            raise HTTPException(status_code=404, detail="Event not found")
+        raise
     
-    if already_saved:
+    if not inserted:
         return {"message": "Event already saved", "saved": True}
     
-    # Save the event
-    db.execute(
-        text("""
-            INSERT INTO user_saved_events (user_id, event_id, saved_at)
-            VALUES (:user_id, :event_id, NOW())
-        """),
-        {"user_id": request.user_id, "event_id": request.event_id}
-    )
-    db.commit()
+    incr_on_commit(db, saved_events_gen_key(str(request.user_id)))
     
     return {"message": "Event saved successfully", "saved": True}
 
 
 @router.delete("/unsave-event")
 def unsave_event(
-    user_id: str,
-    event_id: str,
+    user_id: uuid.UUID,
+    event_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> Dict[str, Any]:
     """Remove a saved event for a user."""
-    result = db.execute(
-        text("""
-            DELETE FROM user_saved_events 
-            WHERE user_id = :user_id AND event_id = :event_id
-        """),
-        {"user_id": user_id, "event_id": event_id}
-    )
-    db.commit()
+    result = db.execute(_DELETE_SAVED_SQL, {"user_id": user_id, "event_id": event_id})
     
     if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Saved event not found")
+    incr_on_commit(db, saved_events_gen_key(str(user_id)))
     
     return {"message": "Event removed from saved list", "saved": False}
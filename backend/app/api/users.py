@@ -1,34 +1,47 @@
 from __future__ import annotations
-from fastapi import APIRouter, Depends, HTTPException
+import json
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Session
-from ..db import SessionLocal
+from ..db import get_db
+from ..cache import cache, delete_on_commit, profile_key
 from ..models.user import User
-from ..recs.embeddings import embed_text
+from ..recs.embeddings import DIM, embed_text
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 class CreateUser(BaseModel):
     email: str
     display_name: str | None = None
 
 @router.post("")
 def create_user(body: CreateUser, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.email == body.email).first():
+    if db.execute(select(User.id).where(User.email == body.email)).first():
         raise HTTPException(status_code=409, detail="exists")
     u = User(email=body.email, display_name=body.display_name)
     db.add(u)
-    db.commit()
-    db.refresh(u)
+    db.flush()  # get id
     return {"id": str(u.id), "email": u.email, "display_name": u.display_name}
 
+# upsert by email in one statement; keep the stored name/embedding when none
+# is given, and never read the embedding back
+_UPSERT_USER = text("""
+    INSERT INTO users (id, email, display_name, interests, embed)
+    VALUES (:id, :email, :display_name, CAST(:interests AS json), :embed)
+    ON CONFLICT (email) DO UPDATE SET
+        display_name = COALESCE(EXCLUDED.display_name, users.display_name),
+        interests = EXCLUDED.interests,
+        embed = COALESCE(EXCLUDED.embed, users.embed)
+    RETURNING id, email, display_name, interests
+""").bindparams(
+    bindparam("id", type_=UUID(as_uuid=True)),
+    bindparam("embed", type_=HALFVEC(DIM)),
+)
+
 class BootstrapIn(BaseModel):
     email: str
     display_name: str | None = None
@@ -36,21 +49,18 @@ class BootstrapIn(BaseModel):
 
 @router.post("/bootstrap")
 def bootstrap_user(body: BootstrapIn, db: Session = Depends(get_db)):
-    # upsert by email
-    u = db.query(User).filter(User.email == body.email).first()
-    if not u:
-        u = User(email=body.email)
-        db.add(u)
-        db.flush()  # get id
-    if body.display_name:
-        u.display_name = body.display_name
-    u.interests = body.interests
     # compute user embedding from interests
     txt = " ".join(body.interests) if body.interests else ""
-    if txt:
-        u.embed = embed_text(txt).tolist()
-    db.commit()
-    db.refresh(u)
+    embed = embed_text(txt).tolist() if txt else None
+
+    u = db.execute(_UPSERT_USER, {
+        "id": uuid.uuid4(),
+        "email": body.email,
+        "display_name": body.display_name or None,
+        "interests": json.dumps(body.interests),
+        "embed": embed,
+    }).one()
+    delete_on_commit(db, profile_key(str(u.id)))
     return {
         "id": str(u.id),
         "email": u.email,
@@ -62,13 +72,19 @@ def bootstrap_user(body: BootstrapIn, db: Session = Depends(get_db)):
 @router.get("/{user_id}")
 def get_user(user_id: str, db: Session = Depends(get_db)):
     """Get user by ID."""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    return {
-        "id": str(user.id),
-        "email": user.email,
-        "display_name": user.display_name,
-        "interests": user.interests or [],
-    }
+    key = profile_key(user_id)
+    payload = cache.get(key)
+    if payload is None:
+        user = db.execute(
+            select(User.id, User.email, User.display_name, User.interests).where(User.id == user_id)
+        ).one_or_none()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        payload = json.dumps({
+            "id": str(user.id),
+            "email": user.email,
+            "display_name": user.display_name,
+            "interests": user.interests or [],
+        })
+        cache.set(key, payload, expire=300)
+    return Response(content=payload, media_type="application/json")
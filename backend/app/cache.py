@@ -0,0 +1,102 @@
+"""Small Redis read-through cache for serialized JSON responses.
+
+The cache is optional: with no REDIS_URL (or Redis unreachable) every get
+misses and set/delete are no-ops, so handlers always fall back to the DB.
+"""
+from __future__ import annotations
+
+import logging
+import os
+
+from sqlalchemy import event
+
+try:
+    import redis
+except ImportError:  # pragma: no cover
+    redis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.environ.get("REDIS_URL")
+
+
+class RedisCache:
+    def __init__(self, url: str | None, max_connections: int = 20):
+        self._url = url
+        self._max_connections = max_connections
+        self._pool = None
+        self._client = None
+
+    def connect(self) -> None:
+        if not self._url or redis is None:
+            return
+        self._pool = redis.ConnectionPool.from_url(
+            self._url, max_connections=self._max_connections, decode_responses=True
+        )
+        self._client = redis.Redis(connection_pool=self._pool)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.disconnect()
+        self._pool = self._client = None
+
+    def get(self, key: str) -> str | None:
+        if self._client is None:
+            return None
+        try:
+            return self._client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"cache get {key} failed: {e}")
+            return None
+
+    def set(self, key: str, value: str, expire: int = 300) -> None:
+        if self._client is None:
+            return
+        try:
+            self._client.set(key, value, ex=expire)
+        except redis.RedisError as e:
+            logger.warning(f"cache set {key} failed: {e}")
+
+    def incr(self, key: str) -> None:
+        if self._client is None:
+            return
+        try:
+            self._client.incr(key)
+        except redis.RedisError as e:
+            logger.warning(f"cache incr {key} failed: {e}")
+
+    def delete(self, *keys: str) -> None:
+        if self._client is None or not keys:
+            return
+        try:
+            self._client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"cache delete {keys} failed: {e}")
+
+
+cache = RedisCache(REDIS_URL)
+
+
+def delete_on_commit(db, *keys: str) -> None:
+    """Drop cache keys once the session's transaction commits (get_db commits at request end)."""
+    event.listen(db, "after_commit", lambda session: cache.delete(*keys), once=True)
+
+
+def incr_on_commit(db, key: str) -> None:
+    """Bump a generation counter once the session's transaction commits."""
+    event.listen(db, "after_commit", lambda session: cache.incr(key), once=True)
+
+
+# saved-events bodies are keyed by a per-user generation, bumped on every
+# save/unsave: a body read before a write commits lands under the old
+# generation, which no reader asks for again
+def saved_events_gen_key(user_id: str) -> str:
+    return f"user:{user_id}:saved_events:gen"
+
+
+def saved_events_key(user_id: str, gen: str) -> str:
+    return f"user:{user_id}:saved_events:{gen}"
+
+
+def profile_key(user_id: str) -> str:
+    return f"user:{user_id}:profile"
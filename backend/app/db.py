@@ -1,7 +1,9 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+from pgvector.asyncpg import register_vector
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 Base = declarative_base()
 
@@ -9,16 +11,49 @@ DATABASE_URL = os.environ.get(
     "DATABASE_URL",
     "postgresql+psycopg2://postgres:postgres@db:5432/recs",
 )
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+# sized for the threadpool (sync endpoints) and the event loop (async ones);
+# keep 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) per worker under max_connections
+POOL_OPTS = dict(
+    pool_size=int(os.environ.get("DB_POOL_SIZE", "25")),
+    max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "25")),
+    pool_recycle=1800,
+    pool_pre_ping=True,
+)
 
 def get_db_url():
     return DATABASE_URL
 
-engine = create_engine(DATABASE_URL, future=True, pool_pre_ping=True)
+def get_async_db_url():
+    return ASYNC_DATABASE_URL.render_as_string(hide_password=False)
+
+# bulk inserts (bulk_insert_events) go out as multi-row VALUES of up to 5000 rows
+engine = create_engine(DATABASE_URL, future=True, insertmanyvalues_page_size=5000, **POOL_OPTS)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 def get_db():
+    # one commit per request, after the handler returns; any error rolls back
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
+
+# async engine for the read-heavy endpoints; pgvector codecs are registered
+# on each new asyncpg connection so vector columns round-trip as numpy arrays
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **POOL_OPTS)
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _register_vector(dbapi_connection, connection_record):
+    dbapi_connection.run_async(register_vector)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
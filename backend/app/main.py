@@ -1,9 +1,47 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, timezone
+import time
+from .cache import cache
+from .recs.embeddings import warm_up
 from .routes import router as api_router
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    cache.connect()
+    # model load is several seconds of CPU; keep it off the event loop
+    await run_in_threadpool(warm_up)
+    yield
+    cache.close()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+class ServerTimingMiddleware:
+    """Adds `Server-Timing: total;dur=<ms>` (time until the response headers go out).
+
+    Plain ASGI rather than @app.middleware("http"), which would wrap every
+    response body in an extra stream.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        t0 = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                dur = (time.perf_counter() - t0) * 1000
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", f"total;dur={dur:.1f}".encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+app.add_middleware(ServerTimingMiddleware)
 
 # Add CORS middleware
 app.add_middleware(
@@ -12,6 +50,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
 @app.get("/health")
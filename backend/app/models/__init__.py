@@ -1,3 +1,5 @@
 from .user import User
 from .event import Event
 from .feedback import Feedback
+from .job import Job
+from .scraper_state import ScraperState
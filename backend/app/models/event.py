@@ -1,15 +1,16 @@
 import uuid
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy import String, Text, DateTime, Integer, Float
+from sqlalchemy import String, Text, DateTime, Integer, Float, Computed, insert, text
 from sqlalchemy.sql import func
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC, BIT
 from ..db import Base
 
 class Event(Base):
     __tablename__ = "events"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # generated by Postgres, so bulk inserts can leave it out (see 0011)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     start_time = mapped_column(DateTime(timezone=True), nullable=False)
@@ -25,8 +26,22 @@ class Event(Base):
 
     raw_s3_uri = mapped_column(String, nullable=True)
 
-    # ✅ pgvector column
-    embed = mapped_column(Vector(384), nullable=True)
+    # ✅ pgvector column (half precision; see ix_events_embed)
+    embed = mapped_column(HALFVEC(384), nullable=True)
+    # binary-quantized embed for the Hamming pre-filter (see api/events.py similar)
+    embed_bin = mapped_column(BIT(384), Computed("binary_quantize(embed)::bit(384)", persisted=True))
 
     popularity = mapped_column(Float, server_default="0")
     created_at = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+def bulk_insert_events(conn, rows: list[dict]) -> int:
+    """Insert many events in one executemany (batched by insertmanyvalues); returns row count.
+
+    ``conn`` is a Connection or Session. Rows are plain dicts keyed by column
+    name; ``embed`` may be a list or ndarray and is bound through HALFVEC.
+    """
+    if not rows:
+        return 0
+    conn.execute(insert(Event), rows)
+    return len(rows)
@@ -0,0 +1,17 @@
+import uuid
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, DateTime
+from sqlalchemy.sql import func
+from ..db import Base
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = mapped_column(String, nullable=False)
+    status = mapped_column(String, nullable=False, server_default="queued")  # queued | running | done | failed
+    started_at = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at = mapped_column(DateTime(timezone=True), nullable=True)
+    result = mapped_column(JSONB, nullable=True)
+    created_at = mapped_column(DateTime(timezone=True), server_default=func.now())
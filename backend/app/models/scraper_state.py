@@ -0,0 +1,13 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, DateTime
+from sqlalchemy.sql import func
+from ..db import Base
+
+class ScraperState(Base):
+    """HTTP cache validators from the last successful scrape of a feed URL."""
+    __tablename__ = "scraper_state"
+
+    source: Mapped[str] = mapped_column(String, primary_key=True)
+    etag = mapped_column(String, nullable=True)
+    last_modified = mapped_column(String, nullable=True)
+    updated_at = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,22 +1,49 @@
 # backend/app/recs/embeddings.py
 from __future__ import annotations
+import os
 import numpy as np
-from functools import lru_cache
+import torch
 from sentence_transformers import SentenceTransformer
 
 DIM = 384
 
-@lru_cache(maxsize=1)
-def _model():
-    return SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+_MODEL: SentenceTransformer | None = None
 
-def _normalize(v: np.ndarray) -> np.ndarray:
-    n = np.linalg.norm(v)
-    return v if n == 0 else (v / n)
+def _model() -> SentenceTransformer:
+    # one shared CPU instance for every caller (reindex, bootstrap, ...), in eval
+    # mode; after warm_up() this is a plain global read
+    global _MODEL
+    if _MODEL is None:
+        torch.set_num_threads(os.cpu_count() or 1)
+        m = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2", device="cpu")
+        m.eval()
+        _MODEL = m
+    return _MODEL
+
+def warm_up() -> None:
+    """Load the model and run one encode so the first request doesn't pay for it."""
+    with torch.inference_mode():
+        _model().encode(["warm up"])
 
 def embed_text(text: str) -> np.ndarray:
     t = (text or "").strip()
     if not t:
         return np.zeros(DIM, dtype=np.float32)
-    v = _model().encode([t])[0].astype(np.float32)
-    return _normalize(v)
+    with torch.inference_mode():
+        v = _model().encode(t, convert_to_numpy=True, normalize_embeddings=True)
+    return v.astype(np.float32, copy=False)
+
+def embed_texts(texts: list[str], batch_size: int = 64) -> np.ndarray:
+    """Embed many texts with one batched encode; empty texts map to zero rows."""
+    out = np.zeros((len(texts), DIM), dtype=np.float32)
+    idx = [i for i, t in enumerate(texts) if (t or "").strip()]
+    if idx:
+        with torch.inference_mode():
+            vecs = _model().encode(
+                [texts[i].strip() for i in idx],
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+            )
+        out[idx] = vecs.astype(np.float32)
+    return out
@@ -1,76 +1,100 @@
 from __future__ import annotations
 import numpy as np
-from datetime import datetime, timezone
 from typing import List, Dict, Any
 from sqlalchemy import text, bindparam
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
 DIM = 384
+RERANK_POOL = 200
 
-def _as_list(v: np.ndarray | list[float] | None) -> list[float]:
+def _as_vec(v: np.ndarray | list[float] | None) -> np.ndarray:
+    # the HALFVEC bind takes ndarrays directly; no per-request Python float list
     if v is None:
-        return [0.0] * DIM
-    if isinstance(v, np.ndarray):
-        return v.astype("float32").tolist()
-    return list(v)
+        return np.zeros(DIM, dtype=np.float32)
+    return np.ascontiguousarray(v, dtype=np.float32)
 
-def _is_zero(v: np.ndarray) -> bool:
-    return float(np.linalg.norm(v)) == 0.0
+def _is_zero(v: np.ndarray | list[float] | None) -> bool:
+    return v is None or not np.any(v)
 
-def similar_events(conn, query_vec: np.ndarray, limit: int = 20) -> List[Dict[str, Any]]:
-    if _is_zero(query_vec):
-        # fallback: upcoming soonest
-        sql = text("""
-            SELECT id, title, start_time, location, tags, 0.0 AS score
-            FROM events
-            WHERE start_time > NOW()
-            ORDER BY start_time ASC
-            LIMIT :lim
-        """)
-        rows = conn.execute(sql, {"lim": limit}).mappings().all()
-        return [dict(r) for r in rows]
+def hnsw_params(n_rows: int) -> Dict[str, int]:
+    """HNSW build/search knobs scaled to table size (pgvector defaults suit ~1e5 rows)."""
+    if n_rows < 100_000:
+        return {"m": 16, "ef_construction": 64, "ef_search": 40}
+    if n_rows < 1_000_000:
+        return {"m": 24, "ef_construction": 128, "ef_search": 100}
+    return {"m": 32, "ef_construction": 200, "ef_search": 200}
+
+# reltuples is the planner's row estimate: a catalog lookup, not a scan
+_EVENTS_RELTUPLES_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'events'")
 
-    sql = text("""
-        SELECT id, title, start_time, location, tags,
-               1 - (embed <=> :q) AS score
+_UPCOMING_SQL = text("""
+    SELECT id, title, description, start_time, location, tags, 0.0 AS score
+    FROM events
+    WHERE start_time > NOW()
+    ORDER BY start_time ASC
+    LIMIT :lim
+""")
+
+# coarse pass: Hamming distance on the 1-bit index picks a candidate pool,
+# then only those rows are reranked by exact (halfvec) cosine
+_SIMILAR_SQL = text("""
+    WITH cand AS (
+        SELECT id
         FROM events
         WHERE start_time > NOW()
-        ORDER BY embed <=> :q
-        LIMIT :lim
-    """).bindparams(bindparam("q", type_=Vector(DIM)))
-    rows = conn.execute(sql, {"q": _as_list(query_vec), "lim": limit}).mappings().all()
-    return [dict(r) for r in rows]
+        ORDER BY embed_bin <~> binary_quantize(CAST(:q AS halfvec(384)))::bit(384)
+        LIMIT :n_cand
+    )
+    SELECT e.id, e.title, e.description, e.start_time, e.location, e.tags,
+           1 - (e.embed <=> :q) AS score
+    FROM events e JOIN cand USING (id)
+    ORDER BY e.embed <=> :q
+    LIMIT :lim
+""").bindparams(bindparam("q", type_=HALFVEC(DIM)))
+
+# same candidate pool, ordered by 0.7 * cosine + 0.3 * linear 14-day recency bonus
+_FEED_SQL = text("""
+    WITH cand AS (
+        SELECT id
+        FROM events
+        WHERE start_time > NOW()
+        ORDER BY embed_bin <~> binary_quantize(CAST(:q AS halfvec(384)))::bit(384)
+        LIMIT :n_cand
+    )
+    SELECT e.id, e.title, e.description, e.start_time, e.location, e.tags,
+           1 - (e.embed <=> :q) AS score,
+           0.7 * (1 - (e.embed <=> :q))
+             + 0.3 * GREATEST(0, 1 - GREATEST(0, EXTRACT(EPOCH FROM (e.start_time - NOW())) / 86400.0) / 14.0)
+             AS rerank_score
+    FROM events e JOIN cand USING (id)
+    ORDER BY rerank_score DESC
+    LIMIT :lim
+""").bindparams(bindparam("q", type_=HALFVEC(DIM)))
+
+def set_ef_search(conn, limit: int) -> None:
+    n = conn.execute(_EVENTS_RELTUPLES_SQL).scalar()
+    ef = max(hnsw_params(int(n or 0))["ef_search"], limit)
+    # SET doesn't take bind params; ef is an int we computed
+    conn.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef)}"))
 
 def user_feed(conn, user_vec: np.ndarray, limit: int = 20) -> List[Dict[str, Any]]:
-    base = similar_events(conn, user_vec, limit=limit * 2)
-    now = datetime.now(timezone.utc)
-    def rerank(ev):
-        dt_days = max(0.0, (ev["start_time"] - now).total_seconds() / 86400.0)
-        time_bonus = max(0.0, 1.0 - dt_days / 14.0)
-        return 0.7 * float(ev.get("score", 0.0)) + 0.3 * time_bonus
-    base.sort(key=rerank, reverse=True)
-    return base[:limit]
+    if _is_zero(user_vec):
+        # no profile: every score is 0, so the rerank is just soonest-first
+        rows = conn.execute(_UPCOMING_SQL, {"lim": limit}).mappings().all()
+        return [dict(r) for r in rows]
+
+    n_cand = max(RERANK_POOL, limit)
+    set_ef_search(conn, n_cand)
+    rows = conn.execute(_FEED_SQL, {"q": _as_vec(user_vec), "n_cand": n_cand, "lim": limit}).mappings().all()
+    return [dict(r) for r in rows]
 
 
 def similar_events(conn, query_vec: np.ndarray, limit: int = 20) -> List[Dict[str, Any]]:
     if _is_zero(query_vec):
-        sql = text("""
-            SELECT id, title, description, start_time, location, tags, 0.0 AS score
-            FROM events
-            WHERE start_time > NOW()
-            ORDER BY start_time ASC
-            LIMIT :lim
-        """)
-        rows = conn.execute(sql, {"lim": limit}).mappings().all()
+        rows = conn.execute(_UPCOMING_SQL, {"lim": limit}).mappings().all()
         return [dict(r) for r in rows]
 
-    sql = text("""
-        SELECT id, title, description, start_time, location, tags,
-               1 - (embed <=> :q) AS score
-        FROM events
-        WHERE start_time > NOW()
-        ORDER BY embed <=> :q
-        LIMIT :lim
-    """).bindparams(bindparam("q", type_=Vector(DIM)))
-    rows = conn.execute(sql, {"q": _as_list(query_vec), "lim": limit}).mappings().all()
+    n_cand = max(RERANK_POOL, limit)
+    set_ef_search(conn, n_cand)
+    rows = conn.execute(_SIMILAR_SQL, {"q": _as_vec(query_vec), "n_cand": n_cand, "lim": limit}).mappings().all()
     return [dict(r) for r in rows]
@@ -7,45 +7,191 @@ https://gatech.campuslabs.com/engage/events.rss
 """
 
 import asyncio
+import hashlib
+import io
+import json
 import logging
 import os
 import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import uuid
 import re
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from types import SimpleNamespace
 
 import aiohttp
-import feedparser
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from lxml import etree
+from dateutil import parser as date_parser
+from dateutil.tz import tzoffset
+from sqlalchemy import case, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 # Add the parent directory to the path to import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from app.db import get_db_url
-from app.models.event import Event
+from app.db import get_async_db_url
+from app.models.event import Event, bulk_insert_events
+from app.models.scraper_state import ScraperState
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# raw feed bodies + a JSON sidecar ({etag, last_modified, fetched_at}) per URL
+CACHE_DIR = os.environ.get(
+    "RSS_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "rss"),
+)
+CACHE_FRESH_SECONDS = 300
+
+# per-event pages are unique (ux_events_url, migration 0010); other links,
+# e.g. an organization page, are shared by many events
+EVENT_LINK_PREFIX = 'https://gatech.campuslabs.com/engage/event/'
+
+# US zone abbreviations CampusLabs appends to event times
+TZINFOS = {
+    'EST': tzoffset('EST', -5 * 3600), 'EDT': tzoffset('EDT', -4 * 3600),
+    'CST': tzoffset('CST', -6 * 3600), 'CDT': tzoffset('CDT', -5 * 3600),
+    'MST': tzoffset('MST', -7 * 3600), 'MDT': tzoffset('MDT', -6 * 3600),
+    'PST': tzoffset('PST', -8 * 3600), 'PDT': tzoffset('PDT', -7 * 3600),
+    'UTC': timezone.utc, 'GMT': timezone.utc,
+}
+
+_DATETIME_RANGE_RE = re.compile(
+    r'(?:From\s+)?(?:[A-Za-z]+,\s+)?'
+    r'(?P<month>[A-Za-z]+)\s+(?P<day>\d{1,2}),\s+(?P<year>\d{4})\s+'
+    r'(?P<hh>\d{1,2}):(?P<mm>\d{2})\s+(?P<ampm>[AP]M)'
+    r'\s+to\s+(?P<end_hh>\d{1,2}):(?P<end_mm>\d{2})\s+(?P<end_ampm>[AP]M)'
+    r'(?:\s+(?-i:(?P<tz>[A-Z]{2,4}))\b)?',
+    re.IGNORECASE,
+)
+
+# "oct" / "october" -> 10; the 12-hour clock maps through a table, not branches
+_MONTHS = {m: i for i, m in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+_AMPM_OFFSET = {'AM': 0, 'PM': 12}
+
+
+def _build_dt(year: str, month: str, day: str, hh: str, mm: str, ampm: str, tz) -> datetime:
+    return datetime(int(year), _MONTHS[month[:3].lower()], int(day),
+                    int(hh) % 12 + _AMPM_OFFSET[ampm.upper()], int(mm), tzinfo=tz)
+
+_HTML_DT_RE = re.compile(r'datetime="([^"]+)"')
+_HTML_DT_SCAN = 512
+
+_LOCATION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'at\s+([^.]+?)(?:\.|$)',
+    r'Location:\s*([^.]+?)(?:\.|$)',
+    r'Where:\s*([^.]+?)(?:\.|$)',
+    r'Venue:\s*([^.]+?)(?:\.|$)',
+)]
+
+# organization names in parentheses, email addresses, "Hosted/Presented by"
+# explicit host markers in one alternation (one scan); whichever alternative
+# matched is the only group set, so match.lastindex points at it
+_HOST_RE = re.compile(
+    r'Hosted by\s+(?P<hosted>[^.]+?)(?:\.|$)'
+    r'|Presented by\s+(?P<presented>[^.]+?)(?:\.|$)'
+    r'|(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[a-zA-Z]{2,})',
+    re.IGNORECASE,
+)
+# last resort: any parenthetical, which is often "(free food)" or "(TBD)"
+_HOST_PAREN_RE = re.compile(r'\(([^)]+)\)')
+
+# Category keywords
+_CATEGORY_KEYWORDS = {
+    'academic': ['lecture', 'seminar', 'workshop', 'conference', 'research', 'academic', 'class', 'symposium', 'study'],
+    'social': ['social', 'party', 'mixer', 'networking', 'meetup', 'gathering', 'reception', 'trivia', 'game'],
+    'sports': ['sports', 'athletics', 'game', 'match', 'tournament', 'fitness', 'gym', 'football', 'basketball', 'volleyball'],
+    'arts': ['art', 'music', 'theater', 'performance', 'exhibition', 'concert', 'dance', 'jazz', 'drama', 'improv'],
+    'career': ['career', 'job', 'internship', 'recruiting', 'interview', 'resume', 'fair', 'networking'],
+    'technology': ['tech', 'coding', 'programming', 'hackathon', 'startup', 'innovation', 'ai', 'machine learning'],
+    'culture': ['culture', 'diversity', 'international', 'heritage', 'celebration', 'festival', 'cultural'],
+    'volunteer': ['volunteer', 'service', 'community', 'outreach', 'charity', 'fundraiser', 'community service'],
+    'student': ['student', 'club', 'organization', 'sga', 'fraternity', 'sorority', 'greek'],
+    'religious': ['religious', 'christian', 'muslim', 'jewish', 'hindu', 'buddhist', 'spiritual', 'faith', 'worship', 'fellowship'],
+    'wellness': ['wellness', 'health', 'mental health', 'support', 'awareness', 'cancer', 'breast cancer']
+}
+
+class _FeedItem(SimpleNamespace):
+    """The few RSS <item> fields the scraper reads, with feedparser's entry.get()"""
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+def _iter_feed_items(raw: io.BytesIO):
+    """Stream <item>s out of an RSS 2.0 body with libxml2 (no HTML sanitizing)"""
+    for _, item in etree.iterparse(raw, events=('end',), tag='item', recover=True, huge_tree=True):
+        fields = _FeedItem()
+        for child in item:
+            if child.tag in ('title', 'link', 'description'):
+                setattr(fields, child.tag, (child.text or '').strip())
+            elif child.tag == 'pubDate' and child.text:
+                try:
+                    published = parsedate_to_datetime(child.text.strip())
+                    if published.tzinfo is None:
+                        published = published.replace(tzinfo=timezone.utc)
+                    fields.published_parsed = published.utctimetuple()
+                except (TypeError, ValueError):
+                    pass
+        yield fields
+        # drop the finished item (and any already-seen siblings) to keep memory flat
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+
+
+# one alternation per category, so the text is scanned once per category
+# instead of once per keyword (plain substring semantics, like `kw in text`)
+_CATEGORY_REGEXES = {
+    category: re.compile('|'.join(map(re.escape, keywords)))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+
+@dataclass(slots=True)
+class ParsedEvent:
+    """One feed item that passed validation, as handed to _store_events"""
+    title: str
+    description: str
+    start_time: datetime
+    end_time: Optional[datetime]
+    location: str
+    url: str
+    tags: List[str]
+    host: str
+    status: str
+
+
 class CampusLabsRSSScraper:
+    # most recent items only; some feeds ship thousands of historical entries
+    MAX_ITEMS = 200
+
     def __init__(self):
         self.session = None
         self.db_session = None
+        self.db_engine = None
+        self._validators = None
         self.rss_url = "https://gatech.campuslabs.com/engage/events.rss"
         
     async def __aenter__(self):
+        # one pooled, keep-alive session for every feed request this run makes;
+        # DNS answers are cached and proxy env vars aren't consulted
         self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60),
+            trust_env=False,
+            raise_for_status=False,
+            timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_read=15),
             headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
         )
         
-        # Setup database connection
-        engine = create_engine(get_db_url())
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        # Setup database connection (async, so DB round-trips don't block the loop)
+        self.db_engine = create_async_engine(get_async_db_url())
+        SessionLocal = async_sessionmaker(self.db_engine, autoflush=False, expire_on_commit=False)
         self.db_session = SessionLocal()
         
         return self
@@ -54,200 +200,193 @@ class CampusLabsRSSScraper:
         if self.session:
             await self.session.close()
         if self.db_session:
-            self.db_session.close()
+            await self.db_session.close()
+            await self.db_engine.dispose()
 
-    async def scrape_rss_events(self) -> List[Dict[str, Any]]:
+    async def scrape_rss_events(self) -> List[ParsedEvent]:
         """Scrape events from CampusLabs RSS feed"""
         events = []
         
+        # a body fetched in the last few minutes is reused as-is (dev reruns,
+        # cron jobs firing more often than the feed changes)
+        cached = await asyncio.to_thread(self._read_cached_feed)
+        if cached and cached[1] < CACHE_FRESH_SECONDS:
+            logger.info(f"Using RSS body cached {cached[1]:.0f}s ago; skipping fetch")
+            return await asyncio.to_thread(self._parse_feed, io.BytesIO(cached[0]))
+        
         try:
             logger.info(f"Scraping RSS feed: {self.rss_url}")
             
-            async with self.session.get(self.rss_url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    feed = feedparser.parse(content)
-                    
-                    logger.info(f"Found {len(feed.entries)} events in RSS feed")
-                    
-                    for i, entry in enumerate(feed.entries):
-                        event_data = self._parse_rss_entry(entry)
-                        if event_data:
-                            if self._is_valid_event(event_data):
-                                events.append(event_data)
-                            else:
-                                logger.debug(f"Event {i+1} '{event_data.get('title', 'Unknown')}' filtered out (invalid)")
-                        else:
-                            logger.debug(f"Event {i+1} '{entry.get('title', 'Unknown')}' could not be parsed")
+            # conditional GET: an unchanged feed answers 304 with no body
+            state = await self.db_session.get(ScraperState, self.rss_url)
+            headers = {}
+            if state and state.etag:
+                headers['If-None-Match'] = state.etag
+            if state and state.last_modified:
+                headers['If-Modified-Since'] = state.last_modified
+            
+            async with self.session.get(self.rss_url, headers=headers) as response:
+                if response.status == 304:
+                    logger.info("RSS feed not modified since last scrape")
+                elif response.status == 200:
+                    # saved with the events, so a failed store is retried next run
+                    self._validators = {
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                    }
+                    # hand the parser the raw bytes; it reads the XML encoding itself,
+                    # so there's no separate decoded str copy of the body
+                    buf = io.BytesIO()
+                    async for chunk in response.content.iter_chunked(65536):
+                        buf.write(chunk)
+                    await asyncio.to_thread(self._write_cached_feed, buf.getbuffer(), self._validators)
+                    buf.seek(0)
+                    # XML parsing + per-entry regex work is pure CPU: do it off the
+                    # event loop so other coroutines (API requests) keep running
+                    events = await asyncio.to_thread(self._parse_feed, buf)
                     
                 else:
                     logger.warning(f"Failed to fetch RSS feed: {response.status}")
+                    if cached:
+                        events = await self._parse_stale(cached)
                     
         except Exception as e:
             logger.error(f"Error scraping RSS feed: {e}")
+            if cached and not events:
+                events = await self._parse_stale(cached)
             
         return events
 
-    def _parse_rss_entry(self, entry) -> Optional[Dict[str, Any]]:
-        """Parse a single RSS entry into event data"""
-        event_data = {
-            'title': entry.get('title', '').strip(),
-            'description': '',
-            'start_time': None,
-            'end_time': None,
-            'location': '',
-            'url': entry.get('link', ''),
-            'tags': [],
-            'host': '',
-            'status': 'confirmed'
-        }
+    async def _parse_stale(self, cached: Tuple[bytes, float]) -> List[ParsedEvent]:
+        logger.info(f"Falling back to the RSS body cached {cached[1]:.0f}s ago")
+        return await asyncio.to_thread(self._parse_feed, io.BytesIO(cached[0]))
+
+    def _cache_paths(self) -> Tuple[str, str]:
+        stem = os.path.join(CACHE_DIR, hashlib.sha1(self.rss_url.encode()).hexdigest())
+        return stem + '.xml', stem + '.json'
+
+    def _read_cached_feed(self) -> Optional[Tuple[bytes, float]]:
+        """Last fetched body and its age in seconds (None if nothing usable is cached)"""
+        body_path, meta_path = self._cache_paths()
+        try:
+            with open(meta_path) as f:
+                fetched_at = datetime.fromisoformat(json.load(f)['fetched_at'])
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        return body, (datetime.now(timezone.utc) - fetched_at).total_seconds()
+
+    def _write_cached_feed(self, body, validators: Dict[str, Any]) -> None:
+        body_path, meta_path = self._cache_paths()
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(body_path, 'wb') as f:
+                f.write(body)
+            # sidecar last, so a half-written body is never treated as fresh
+            with open(meta_path, 'w') as f:
+                json.dump({**validators, 'fetched_at': datetime.now(timezone.utc).isoformat()}, f)
+        except OSError as e:
+            logger.warning(f"Could not cache RSS body: {e}")
+
+    def _parse_feed(self, raw: io.BytesIO) -> List[ParsedEvent]:
+        """Parse the feed body and keep the valid events"""
+        # For RSS feeds, be more lenient with dates since they might be published dates
+        # Allow events from the past week to future events
+        now = datetime.now(timezone.utc)
+        not_before, not_after = now - timedelta(days=7), now + timedelta(days=365)
         
-        # Extract description
-        if hasattr(entry, 'description'):
-            event_data['description'] = entry.description.strip()
-        elif hasattr(entry, 'summary'):
-            event_data['description'] = entry.summary.strip()
+        events = []
+        i = -1
+        # the feed's order isn't guaranteed, so an out-of-window item is only
+        # skipped; MAX_ITEMS bounds the work (the iterator is lazy, so the
+        # cap also stops the XML parse)
+        for i, entry in enumerate(islice(_iter_feed_items(raw), self.MAX_ITEMS)):
+            event = self._parse_rss_entry(entry, not_before, not_after)
+            if event:
+                events.append(event)
+            else:
+                logger.debug(f"Event {i+1} '{entry.get('title', 'Unknown')}' filtered out (unparseable or invalid)")
+        logger.info(f"Read {i+1} items from RSS feed, kept {len(events)} events")
+        return events
+
+    def _parse_rss_entry(self, entry, not_before: datetime, not_after: datetime) -> Optional[ParsedEvent]:
+        """Parse a single RSS entry into event data (None if it isn't worth storing)"""
+        # cheap validity checks first, so rejected entries skip the regex work
+        title = entry.get('title', '').strip()
+        # Must have a title
+        if len(title) < 3:
+            return None
+        
+        # Extract description (read once; the extract helpers use IGNORECASE
+        # patterns on it, and only tag generation needs a lowercased copy)
+        desc = (entry.get('description') or entry.get('summary') or '').strip()
         
         # Try to extract more detailed date/time from description first
-        date_info = self._extract_datetime_from_description(event_data['description'])
+        start_time = end_time = None
+        date_info = self._extract_datetime_from_description(desc)
         if date_info:
-            event_data.update(date_info)
-        else:
+            start_time, end_time = date_info['start_time'], date_info.get('end_time')
+        elif entry.get('published_parsed'):
             # Fall back to published date if no specific event time found
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                event_data['start_time'] = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-        
-        # Extract location from description
-        location = self._extract_location_from_description(event_data['description'])
-        if location:
-            event_data['location'] = location
+            start_time = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
         
-        # Extract host organization
-        host = self._extract_host_from_description(event_data['description'])
-        if host:
-            event_data['host'] = host
+        # Must have a start time inside the window (checked before the
+        # location/host/tag regexes, so out-of-window items skip that work)
+        if not start_time or not (not_before <= start_time <= not_after):
+            return None
         
         # Generate tags based on content
-        event_data['tags'] = self._generate_tags(event_data)
-        
-        # Check if event is cancelled
-        if 'cancelled' in event_data['description'].lower() or 'cancelled' in event_data['title'].lower():
-            event_data['status'] = 'cancelled'
-        
-        return event_data
+        tags = self._generate_tags(title.lower(), desc.lower())
+        
+        return ParsedEvent(
+            title=title,
+            description=desc,
+            start_time=start_time,
+            end_time=end_time,
+            location=self._extract_location_from_description(desc) or '',
+            url=entry.get('link', ''),
+            tags=tags,
+            host=self._extract_host_from_description(desc) or '',
+            # _generate_tags already scanned title + description for it
+            status='cancelled' if 'cancelled' in tags else 'confirmed',
+        )
 
     def _extract_datetime_from_description(self, description: str) -> Optional[Dict[str, Any]]:
         """Extract date and time information from event description"""
         if not description:
             return None
         
-        # First try to extract from HTML datetime attributes
-        datetime_match = re.search(r'datetime="([^"]+)"', description)
+        # Fast path: CampusLabs puts <time datetime="..."> (ISO 8601) at the top
+        # of the description, so only the first 512 chars are searched
+        datetime_match = _HTML_DT_RE.search(description, 0, _HTML_DT_SCAN)
         if datetime_match:
             try:
-                from dateutil import parser as date_parser
                 dt_str = datetime_match.group(1)
-                parsed_dt = date_parser.parse(dt_str)
+                try:
+                    parsed_dt = date_parser.isoparse(dt_str)
+                except ValueError:
+                    parsed_dt = date_parser.parse(dt_str)
                 if parsed_dt.tzinfo is None:
                     parsed_dt = parsed_dt.replace(tzinfo=timezone.utc)
                 return {'start_time': parsed_dt}
             except Exception as e:
                 logger.warning(f"Error parsing HTML datetime: {e}")
         
-        # Look for patterns like "From Friday, October 24, 2025 6:00 PM to 8:00 PM EDT"
-        datetime_patterns = [
-            r'From\s+(\w+),\s+(\w+)\s+(\d+),\s+(\d+)\s+(\d+):(\d+)\s+(AM|PM)\s+to\s+(\d+):(\d+)\s+(AM|PM)\s+(\w+)',
-            r'(\w+),\s+(\w+)\s+(\d+),\s+(\d+)\s+(\d+):(\d+)\s+(AM|PM)\s+to\s+(\d+):(\d+)\s+(AM|PM)',
-            r'(\w+)\s+(\d+),\s+(\d+)\s+(\d+):(\d+)\s+(AM|PM)\s+to\s+(\d+):(\d+)\s+(AM|PM)'
-        ]
-        
-        for pattern in datetime_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                try:
-                    # Parse the date components
-                    groups = match.groups()
-                    if len(groups) >= 6:
-                        # Extract start time
-                        start_time = self._parse_datetime_from_groups(groups)
-                        if start_time:
-                            result = {'start_time': start_time}
-                            
-                            # Try to extract end time if available
-                            if len(groups) >= 10:
-                                end_time = self._parse_endtime_from_groups(groups)
-                                if end_time:
-                                    result['end_time'] = end_time
-                            
-                            return result
-                except Exception as e:
-                    logger.warning(f"Error parsing datetime: {e}")
-                    continue
-        
-        return None
-
-    def _parse_datetime_from_groups(self, groups) -> Optional[datetime]:
-        """Parse datetime from regex groups"""
-        try:
-            # Handle different group patterns
-            if len(groups) >= 6:
-                # Pattern: From Friday, October 24, 2025 6:00 PM to 8:00 PM EDT
-                month_name = groups[1]
-                day = int(groups[2])
-                year = int(groups[3])
-                hour = int(groups[4])
-                minute = int(groups[5])
-                ampm = groups[6]
-                
-                # Convert to 24-hour format
-                if ampm.upper() == 'PM' and hour != 12:
-                    hour += 12
-                elif ampm.upper() == 'AM' and hour == 12:
-                    hour = 0
-                
-                # Convert month name to number
-                month_map = {
-                    'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                    'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                    'september': 9, 'october': 10, 'november': 11, 'december': 12
-                }
-                month = month_map.get(month_name.lower(), 1)
-                
-                return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
-        except Exception as e:
-            logger.warning(f"Error parsing datetime groups: {e}")
-        
-        return None
-
-    def _parse_endtime_from_groups(self, groups) -> Optional[datetime]:
-        """Parse end time from regex groups"""
-        try:
-            if len(groups) >= 10:
-                # Extract end time components
-                month_name = groups[1]
-                day = int(groups[2])
-                year = int(groups[3])
-                end_hour = int(groups[7])
-                end_minute = int(groups[8])
-                end_ampm = groups[9]
-                
-                # Convert to 24-hour format
-                if end_ampm.upper() == 'PM' and end_hour != 12:
-                    end_hour += 12
-                elif end_ampm.upper() == 'AM' and end_hour == 12:
-                    end_hour = 0
-                
-                # Convert month name to number
-                month_map = {
-                    'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                    'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                    'september': 9, 'october': 10, 'november': 11, 'december': 12
-                }
-                month = month_map.get(month_name.lower(), 1)
-                
-                return datetime(year, month, day, end_hour, end_minute, tzinfo=timezone.utc)
-        except Exception as e:
-            logger.warning(f"Error parsing end time: {e}")
+        # Slow path: "From Friday, October 24, 2025 6:00 PM to 8:00 PM EDT" (weekday, "From"
+        # and zone optional): one pass, fields read straight from the named groups
+        match = _DATETIME_RANGE_RE.search(description)
+        if match:
+            g = match.groupdict()
+            try:
+                tz = TZINFOS.get(g['tz'], timezone.utc)
+                date = (g['year'], g['month'], g['day'])
+                start_time = _build_dt(*date, g['hh'], g['mm'], g['ampm'], tz)
+                # the end is a bare time on the same day
+                end_time = _build_dt(*date, g['end_hh'], g['end_mm'], g['end_ampm'], tz)
+                return {'start_time': start_time, 'end_time': end_time}
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Error parsing datetime: {e}")
         
         return None
 
@@ -257,15 +396,8 @@ class CampusLabsRSSScraper:
             return None
         
         # Look for "at [location]" pattern
-        location_patterns = [
-            r'at\s+([^.]+?)(?:\.|$)',
-            r'Location:\s*([^.]+?)(?:\.|$)',
-            r'Where:\s*([^.]+?)(?:\.|$)',
-            r'Venue:\s*([^.]+?)(?:\.|$)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(description)
             if match:
                 location = match.group(1).strip()
                 if location and len(location) < 100:  # Reasonable location length
@@ -278,85 +410,42 @@ class CampusLabsRSSScraper:
         if not description:
             return None
         
-        # Look for organization names in parentheses or email addresses
-        host_patterns = [
-            r'\(([^)]+)\)',
-            r'([a-zA-Z\s]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-            r'Hosted by\s+([^.]+?)(?:\.|$)',
-            r'Presented by\s+([^.]+?)(?:\.|$)'
-        ]
-        
-        for pattern in host_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        # "Hosted by" / "Presented by" / an email address, then a parenthetical
+        for pattern in (_HOST_RE, _HOST_PAREN_RE):
+            match = pattern.search(description)
             if match:
-                host = match.group(1).strip()
+                host = match.group(match.lastindex).strip()
                 if host and len(host) < 100:
                     return host
         
         return None
 
-    def _generate_tags(self, event_data: Dict[str, Any]) -> List[str]:
-        """Generate tags based on event content"""
+    def _generate_tags(self, title_lc: str, desc_lc: str) -> List[str]:
+        """Generate tags from the already-lowercased title and description"""
         tags = set()
+        texts = (title_lc, desc_lc)
         
-        text = f"{event_data.get('title', '')} {event_data.get('description', '')}".lower()
-        
-        # Category keywords
-        category_keywords = {
-            'academic': ['lecture', 'seminar', 'workshop', 'conference', 'research', 'academic', 'class', 'symposium', 'study'],
-            'social': ['social', 'party', 'mixer', 'networking', 'meetup', 'gathering', 'reception', 'trivia', 'game'],
-            'sports': ['sports', 'athletics', 'game', 'match', 'tournament', 'fitness', 'gym', 'football', 'basketball', 'volleyball'],
-            'arts': ['art', 'music', 'theater', 'performance', 'exhibition', 'concert', 'dance', 'jazz', 'drama', 'improv'],
-            'career': ['career', 'job', 'internship', 'recruiting', 'interview', 'resume', 'fair', 'networking'],
-            'technology': ['tech', 'coding', 'programming', 'hackathon', 'startup', 'innovation', 'ai', 'machine learning'],
-            'culture': ['culture', 'diversity', 'international', 'heritage', 'celebration', 'festival', 'cultural'],
-            'volunteer': ['volunteer', 'service', 'community', 'outreach', 'charity', 'fundraiser', 'community service'],
-            'student': ['student', 'club', 'organization', 'sga', 'fraternity', 'sorority', 'greek'],
-            'religious': ['religious', 'christian', 'muslim', 'jewish', 'hindu', 'buddhist', 'spiritual', 'faith', 'worship', 'fellowship'],
-            'wellness': ['wellness', 'health', 'mental health', 'support', 'awareness', 'cancer', 'breast cancer']
-        }
-        
-        for category, keywords in category_keywords.items():
-            if any(keyword in text for keyword in keywords):
+        for category, rx in _CATEGORY_REGEXES.items():
+            if any(rx.search(t) for t in texts):
                 tags.add(category)
         
         # Add specific tags based on content
-        if 'cancelled' in text:
+        def mentions(*words: str) -> bool:
+            return any(w in t for t in texts for w in words)
+        
+        if mentions('cancelled'):
             tags.add('cancelled')
-        if 'free' in text:
+        if mentions('free'):
             tags.add('free')
-        if 'food' in text:
+        if mentions('food'):
             tags.add('food')
-        if 'first year' in text or 'fywe' in text:
+        if mentions('first year', 'fywe'):
             tags.add('first-year')
-        if 'grad' in text:
+        if mentions('grad'):
             tags.add('graduate-student')
         
         return list(tags)
 
-    def _is_valid_event(self, event_data: Dict[str, Any]) -> bool:
-        """Check if event data is valid and worth storing"""
-        # Must have a title
-        if not event_data.get('title') or len(event_data['title']) < 3:
-            return False
-            
-        # Must have a start time
-        if not event_data.get('start_time'):
-            return False
-            
-        # For RSS feeds, be more lenient with dates since they might be published dates
-        # Allow events from the past week to future events
-        one_week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-        one_year_future = datetime.now(timezone.utc) + timedelta(days=365)
-        
-        if event_data['start_time'] < one_week_ago:
-            return False
-            
-        if event_data['start_time'] > one_year_future:
-            return False
-            
-        return True
-
     async def scrape_and_store_events(self) -> int:
         """Main method to scrape events and store them in the database"""
         logger.info("Starting CampusLabs RSS events scraping...")
@@ -367,65 +456,117 @@ class CampusLabsRSSScraper:
         logger.info(f"Total events scraped: {len(events)}")
         
         # Store events in database
-        stored_count = 0
-        for event_data in events:
-            try:
-                if await self._store_event(event_data):
-                    stored_count += 1
-            except Exception as e:
-                logger.error(f"Error storing event '{event_data.get('title', 'Unknown')}': {e}")
-                
+        stored_count = await self._store_events(events)
+        
         logger.info(f"Successfully stored {stored_count} RSS events")
         return stored_count
 
-    async def _store_event(self, event_data: Dict[str, Any]) -> bool:
-        """Store a single event in the database"""
+    async def _store_events(self, events: List[ParsedEvent]) -> int:
+        """Upsert scraped events: one ON CONFLICT (url) insert, plus a lookup for the rest"""
+        if not events and not self._validators:
+            return 0
         try:
-            # Check if event already exists (by URL or title + start_time)
-            existing = None
-            if event_data.get('url'):
-                existing = self.db_session.query(Event).filter(
-                    Event.url == event_data['url']
-                ).first()
-            
-            if not existing and event_data.get('title') and event_data.get('start_time'):
-                existing = self.db_session.query(Event).filter(
-                    Event.title == event_data['title'],
-                    Event.start_time == event_data['start_time']
-                ).first()
+            # Events with their own event page: fold repeats within the feed (one
+            # statement can't touch the same row twice), then let ux_events_url decide
+            by_url: Dict[str, Dict[str, Any]] = {}
+            unlinked: List[ParsedEvent] = []
+            for event in events:
+                if not event.url.startswith(EVENT_LINK_PREFIX):
+                    unlinked.append(event)
+                    continue
+                row = by_url.get(event.url)
+                if row:
+                    self._fill_in(row, event)
+                    continue
+                by_url[event.url] = self._event_row(event)
             
-            if existing:
-                # Update existing event
-                existing.description = event_data.get('description') or existing.description
-                existing.location = event_data.get('location') or existing.location
-                existing.host = event_data.get('host') or existing.host
-                existing.tags = event_data.get('tags') or existing.tags
-                existing.url = event_data.get('url') or existing.url
-                if event_data.get('end_time'):
-                    existing.end_time = event_data['end_time']
-                self.db_session.commit()
-                return True
-            else:
-                # Create new event
-                new_event = Event(
-                    id=uuid.uuid4(),
-                    title=event_data['title'],
-                    description=event_data.get('description', ''),
-                    start_time=event_data['start_time'],
-                    end_time=event_data.get('end_time'),
-                    location=event_data.get('location', ''),
-                    host=event_data.get('host', ''),
-                    url=event_data.get('url', ''),
-                    tags=event_data.get('tags', []),
+            stored = 0
+            if by_url:
+                stmt = pg_insert(Event).values(list(by_url.values()))
+                new = stmt.excluded
+                # update only the fields the scrape actually filled in
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Event.url],
+                    # literal predicate: index inference can't see through a bound value
+                    index_where=text(f"url LIKE '{EVENT_LINK_PREFIX}%'"),
+                    set_={
+                        'description': func.coalesce(func.nullif(new.description, ''), Event.description),
+                        'location': func.coalesce(func.nullif(new.location, ''), Event.location),
+                        'host': func.coalesce(func.nullif(new.host, ''), Event.host),
+                        'tags': case((func.cardinality(new.tags) > 0, new.tags), else_=Event.tags),
+                        'end_time': func.coalesce(new.end_time, Event.end_time),
+                    },
                 )
-                self.db_session.add(new_event)
-                self.db_session.commit()
-                return True
-                
+                await self.db_session.execute(stmt)
+                stored += len(by_url)
+            
+            if unlinked:
+                stored += await self._store_unlinked_events(unlinked)
+            
+            if self._validators:
+                stmt = pg_insert(ScraperState).values(source=self.rss_url, **self._validators)
+                await self.db_session.execute(stmt.on_conflict_do_update(
+                    index_elements=[ScraperState.source],
+                    set_={**self._validators, 'updated_at': func.now()},
+                ))
+            await self.db_session.commit()
+            return stored
+
         except Exception as e:
-            self.db_session.rollback()
-            logger.error(f"Database error storing event: {e}")
-            return False
+            await self.db_session.rollback()
+            logger.error(f"Database error storing events: {e}")
+            return 0
+
+    @staticmethod
+    def _event_row(event: ParsedEvent) -> Dict[str, Any]:
+        # no 'id': Postgres fills it from gen_random_uuid()
+        return {
+            'title': event.title,
+            'description': event.description,
+            'start_time': event.start_time,
+            'end_time': event.end_time,
+            'location': event.location,
+            'host': event.host,
+            'url': event.url,
+            'tags': event.tags,
+        }
+
+    @staticmethod
+    def _fill_in(row: Dict[str, Any], event: ParsedEvent) -> None:
+        """Copy the fields this scrape actually filled in onto a pending row"""
+        for field in ('description', 'location', 'host', 'tags', 'end_time'):
+            value = getattr(event, field)
+            if value:
+                row[field] = value
+
+    async def _store_unlinked_events(self, events: List[ParsedEvent]) -> int:
+        """Events without an event-page link: match by (title, start_time), then bulk insert / bulk update"""
+        keys = list({(e.title, e.start_time) for e in events})
+        existing_by_key = {
+            (title, start_time): id_ for title, start_time, id_ in (await self.db_session.execute(
+                select(Event.title, Event.start_time, Event.id)
+                .where(tuple_(Event.title, Event.start_time).in_(keys))
+            )).all()
+        }
+
+        updates: Dict[uuid.UUID, Dict[str, Any]] = {}
+        new_rows: Dict[Any, Dict[str, Any]] = {}
+        for event in events:
+            key = (event.title, event.start_time)
+            event_id = existing_by_key.get(key)
+            # repeats within the feed fold into the first row
+            row = updates.setdefault(event_id, {'id': event_id}) if event_id else new_rows.get(key)
+            if row:
+                self._fill_in(row, event)
+                continue
+            new_rows[key] = self._event_row(event)
+
+        if new_rows:
+            await self.db_session.run_sync(bulk_insert_events, list(new_rows.values()))
+        if updates:
+            # ORM bulk UPDATE by primary key (rows grouped by which fields changed)
+            await self.db_session.execute(update(Event), list(updates.values()))
+        return len(new_rows) + len(updates)
 
 async def main():
     """Main function to run the RSS scraper"""
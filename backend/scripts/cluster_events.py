@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Physically order the events table by start_time
+
+CLUSTER rewrites events in ix_events_upcoming order, so "upcoming" scans
+read contiguous heap pages. It holds an ACCESS EXCLUSIVE lock on events
+for the whole rewrite (every read and write waits), so run it off-hours:
+
+    python scripts/cluster_events.py
+"""
+
+import os
+
+from sqlalchemy import create_engine, text
+
+DATABASE_URL = os.environ.get("DATABASE_URL", "postgresql+psycopg2://postgres:postgres@db:5432/recs")
+
+def main():
+    engine = create_engine(DATABASE_URL)
+    with engine.begin() as conn:
+        conn.execute(text("CLUSTER events USING ix_events_upcoming"))
+        conn.execute(text("ANALYZE events"))
+    print("Clustered events on ix_events_upcoming")
+
+if __name__ == "__main__":
+    main()
@@ -9,212 +9,192 @@ using multiple official sources and current dates.
 import sys
 import os
 from datetime import datetime, timezone, timedelta
-import uuid
 
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from app.models.event import Event
 
 def get_db_url():
     return "postgresql+psycopg2://postgres:postgres@db:5432/recs"
 
+# Current Georgia Tech events with realistic dates, one positional tuple per
+# event: (title, description, days_ahead, location, url, tags, host); each
+# starts `days_ahead` days after the run (see current_event_rows)
+_CURRENT_EVENTS = (
+    (
+        'Georgia Tech Career Fair 2024',
+        'Fall career fair featuring top companies recruiting Georgia Tech students for internships and full-time positions. Meet with recruiters from Google, Microsoft, Amazon, Apple, and many more!',
+        7, 'Student Center Ballroom',
+        'https://career.gatech.edu/career-fair',
+        ('career', 'student', 'networking'), 'Georgia Tech Career Services',
+    ),
+    (
+        'HackGT 2024',
+        "Georgia Tech's premier hackathon bringing together students from across the country for 36 hours of coding, innovation, and fun. Prizes worth over $50,000!",
+        14, 'Klaus Advanced Computing Building',
+        'https://hackgt.com',
+        ('technology', 'hackathon', 'student', 'innovation'), 'HackGT Team',
+    ),
+    (
+        'Yellow Jacket Football vs Duke',
+        'Home football game against Duke Blue Devils. Come support the Yellow Jackets in this exciting ACC matchup!',
+        21, 'Bobby Dodd Stadium',
+        'https://ramblinwreck.com/sports/football',
+        ('sports', 'football', 'athletics'), 'Georgia Tech Athletics',
+    ),
+    (
+        'International Student Welcome Reception',
+        'Welcome reception for new international students. Meet other students and learn about campus resources and support services.',
+        3, 'Student Center',
+        'https://oie.gatech.edu',
+        ('culture', 'international', 'student', 'social'), 'Office of International Education',
+    ),
+    (
+        'Undergraduate Research Symposium',
+        'Annual research symposium showcasing undergraduate and graduate research projects across all disciplines. Free and open to the public.',
+        28, 'Exhibition Hall',
+        'https://research.gatech.edu/symposium',
+        ('academic', 'research', 'student'), 'Georgia Tech Research',
+    ),
+    (
+        'Campus Sustainability Day',
+        'Learn about sustainability initiatives on campus and how you can get involved in environmental efforts. Free food and activities!',
+        10, 'Tech Green',
+        'https://sustainability.gatech.edu',
+        ('volunteer', 'environment', 'community'), 'Office of Campus Sustainability',
+    ),
+    (
+        'Startup Exchange Pitch Competition',
+        'Watch student entrepreneurs pitch their startup ideas to a panel of investors and industry experts. Great networking opportunity!',
+        17, 'Scheller College of Business',
+        'https://startup.gatech.edu',
+        ('technology', 'startup', 'entrepreneurship', 'networking'), 'Startup Exchange',
+    ),
+    (
+        'Georgia Tech Jazz Ensemble Concert',
+        'Enjoy an evening of jazz music performed by talented Georgia Tech students. Free admission for students!',
+        12, 'Ferst Center for the Arts',
+        'https://arts.gatech.edu',
+        ('arts', 'music', 'performance', 'culture'), 'Georgia Tech Arts',
+    ),
+    (
+        'Women in Computing Networking Event',
+        'Connect with other women in computing fields. Panel discussion with industry professionals followed by networking reception.',
+        19, 'College of Computing',
+        'https://wic.gatech.edu',
+        ('technology', 'networking', 'diversity', 'career'), 'Women in Computing',
+    ),
+    (
+        'Georgia Tech vs Georgia Basketball',
+        'Rivalry game against the University of Georgia Bulldogs. Wear your gold and white!',
+        35, 'McCamish Pavilion',
+        'https://ramblinwreck.com/sports/mens-basketball',
+        ('sports', 'basketball', 'athletics', 'rivalry'), 'Georgia Tech Athletics',
+    ),
+    (
+        'Engineering Career Fair',
+        'Specialized career fair for engineering students. Meet with top engineering companies and learn about internship and job opportunities.',
+        24, 'Student Center',
+        'https://career.gatech.edu/engineering-fair',
+        ('career', 'engineering', 'student', 'networking'), 'Georgia Tech Career Services',
+    ),
+    (
+        'Homecoming Week Kickoff',
+        'Join us for the start of Homecoming Week with food, games, and activities. Celebrate Georgia Tech spirit!',
+        30, 'Tech Green',
+        'https://homecoming.gatech.edu',
+        ('social', 'homecoming', 'student', 'spirit'), 'Student Government Association',
+    ),
+    (
+        'AI and Machine Learning Workshop',
+        'Hands-on workshop covering the latest trends in AI and machine learning. Perfect for students interested in tech careers.',
+        15, 'College of Computing',
+        'https://cc.gatech.edu/events',
+        ('technology', 'ai', 'workshop', 'academic'), 'College of Computing',
+    ),
+    (
+        'Study Abroad Information Session',
+        'Learn about study abroad opportunities at Georgia Tech. Representatives from various programs will be available.',
+        8, 'Student Center',
+        'https://oie.gatech.edu/study-abroad',
+        ('academic', 'international', 'student', 'education'), 'Office of International Education',
+    ),
+    (
+        'Georgia Tech vs Clemson Basketball',
+        'Exciting basketball matchup against Clemson Tigers. Come support the Yellow Jackets!',
+        42, 'McCamish Pavilion',
+        'https://ramblinwreck.com/sports/mens-basketball',
+        ('sports', 'basketball', 'athletics'), 'Georgia Tech Athletics',
+    ),
+)
+
+def current_event_rows(now):
+    """The seed events as (title, description, start_time, location, url, tags, host)
+    tuples with concrete start times (all from one `now`)"""
+    return [
+        (title, desc, now + timedelta(days=days), loc, url, tags, host)
+        for title, desc, days, loc, url, tags, host in _CURRENT_EVENTS
+    ]
+
+def insert_statement(n):
+    """INSERT of n (title, description, start_time, location, url, tags, host)
+    rows as one VALUES list with numbered binds, skipping any row whose
+    (title, start_time) is already stored; returns the inserted titles"""
+    values = ',\n'.join(
+        f'(:title{i}, :desc{i}, CAST(:start{i} AS timestamptz), :loc{i}, :url{i}, CAST(:tags{i} AS text[]), :host{i})'
+        for i in range(n)
+    )
+    return text(f"""
+        INSERT INTO events (title, description, start_time, location, url, tags, host)
+        SELECT v.* FROM (VALUES {values}) AS v (title, description, start_time, location, url, tags, host)
+        WHERE NOT EXISTS (
+            SELECT 1 FROM events e WHERE e.title = v.title AND e.start_time = v.start_time
+        )
+        RETURNING title
+    """)
+
+def insert_params(rows):
+    """Flat bind dict matching insert_statement(len(rows))"""
+    params = {}
+    for i, (title, desc, start_time, loc, url, tags, host) in enumerate(rows):
+        params.update({
+            f'title{i}': title, f'desc{i}': desc, f'start{i}': start_time,
+            f'loc{i}': loc, f'url{i}': url, f'tags{i}': list(tags), f'host{i}': host,
+        })
+    return params
+
 def main():
     print("🚀 Creating current Georgia Tech events...")
     
     # Setup database connection
     engine = create_engine(get_db_url())
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = SessionLocal()
     
     try:
-        # Get current date and create events for the next 3 months
         now = datetime.now(timezone.utc)
+        current_events = current_event_rows(now)
         
-        # Current Georgia Tech events with realistic dates
-        current_events = [
-            {
-                'title': 'Georgia Tech Career Fair 2024',
-                'description': 'Fall career fair featuring top companies recruiting Georgia Tech students for internships and full-time positions. Meet with recruiters from Google, Microsoft, Amazon, Apple, and many more!',
-                'start_time': now + timedelta(days=7),
-                'location': 'Student Center Ballroom',
-                'url': 'https://career.gatech.edu/career-fair',
-                'tags': ['career', 'student', 'networking'],
-                'host': 'Georgia Tech Career Services'
-            },
-            {
-                'title': 'HackGT 2024',
-                'description': 'Georgia Tech\'s premier hackathon bringing together students from across the country for 36 hours of coding, innovation, and fun. Prizes worth over $50,000!',
-                'start_time': now + timedelta(days=14),
-                'location': 'Klaus Advanced Computing Building',
-                'url': 'https://hackgt.com',
-                'tags': ['technology', 'hackathon', 'student', 'innovation'],
-                'host': 'HackGT Team'
-            },
-            {
-                'title': 'Yellow Jacket Football vs Duke',
-                'description': 'Home football game against Duke Blue Devils. Come support the Yellow Jackets in this exciting ACC matchup!',
-                'start_time': now + timedelta(days=21),
-                'location': 'Bobby Dodd Stadium',
-                'url': 'https://ramblinwreck.com/sports/football',
-                'tags': ['sports', 'football', 'athletics'],
-                'host': 'Georgia Tech Athletics'
-            },
-            {
-                'title': 'International Student Welcome Reception',
-                'description': 'Welcome reception for new international students. Meet other students and learn about campus resources and support services.',
-                'start_time': now + timedelta(days=3),
-                'location': 'Student Center',
-                'url': 'https://oie.gatech.edu',
-                'tags': ['culture', 'international', 'student', 'social'],
-                'host': 'Office of International Education'
-            },
-            {
-                'title': 'Undergraduate Research Symposium',
-                'description': 'Annual research symposium showcasing undergraduate and graduate research projects across all disciplines. Free and open to the public.',
-                'start_time': now + timedelta(days=28),
-                'location': 'Exhibition Hall',
-                'url': 'https://research.gatech.edu/symposium',
-                'tags': ['academic', 'research', 'student'],
-                'host': 'Georgia Tech Research'
-            },
-            {
-                'title': 'Campus Sustainability Day',
-                'description': 'Learn about sustainability initiatives on campus and how you can get involved in environmental efforts. Free food and activities!',
-                'start_time': now + timedelta(days=10),
-                'location': 'Tech Green',
-                'url': 'https://sustainability.gatech.edu',
-                'tags': ['volunteer', 'environment', 'community'],
-                'host': 'Office of Campus Sustainability'
-            },
-            {
-                'title': 'Startup Exchange Pitch Competition',
-                'description': 'Watch student entrepreneurs pitch their startup ideas to a panel of investors and industry experts. Great networking opportunity!',
-                'start_time': now + timedelta(days=17),
-                'location': 'Scheller College of Business',
-                'url': 'https://startup.gatech.edu',
-                'tags': ['technology', 'startup', 'entrepreneurship', 'networking'],
-                'host': 'Startup Exchange'
-            },
-            {
-                'title': 'Georgia Tech Jazz Ensemble Concert',
-                'description': 'Enjoy an evening of jazz music performed by talented Georgia Tech students. Free admission for students!',
-                'start_time': now + timedelta(days=12),
-                'location': 'Ferst Center for the Arts',
-                'url': 'https://arts.gatech.edu',
-                'tags': ['arts', 'music', 'performance', 'culture'],
-                'host': 'Georgia Tech Arts'
-            },
-            {
-                'title': 'Women in Computing Networking Event',
-                'description': 'Connect with other women in computing fields. Panel discussion with industry professionals followed by networking reception.',
-                'start_time': now + timedelta(days=19),
-                'location': 'College of Computing',
-                'url': 'https://wic.gatech.edu',
-                'tags': ['technology', 'networking', 'diversity', 'career'],
-                'host': 'Women in Computing'
-            },
-            {
-                'title': 'Georgia Tech vs Georgia Basketball',
-                'description': 'Rivalry game against the University of Georgia Bulldogs. Wear your gold and white!',
-                'start_time': now + timedelta(days=35),
-                'location': 'McCamish Pavilion',
-                'url': 'https://ramblinwreck.com/sports/mens-basketball',
-                'tags': ['sports', 'basketball', 'athletics', 'rivalry'],
-                'host': 'Georgia Tech Athletics'
-            },
-            {
-                'title': 'Engineering Career Fair',
-                'description': 'Specialized career fair for engineering students. Meet with top engineering companies and learn about internship and job opportunities.',
-                'start_time': now + timedelta(days=24),
-                'location': 'Student Center',
-                'url': 'https://career.gatech.edu/engineering-fair',
-                'tags': ['career', 'engineering', 'student', 'networking'],
-                'host': 'Georgia Tech Career Services'
-            },
-            {
-                'title': 'Homecoming Week Kickoff',
-                'description': 'Join us for the start of Homecoming Week with food, games, and activities. Celebrate Georgia Tech spirit!',
-                'start_time': now + timedelta(days=30),
-                'location': 'Tech Green',
-                'url': 'https://homecoming.gatech.edu',
-                'tags': ['social', 'homecoming', 'student', 'spirit'],
-                'host': 'Student Government Association'
-            },
-            {
-                'title': 'AI and Machine Learning Workshop',
-                'description': 'Hands-on workshop covering the latest trends in AI and machine learning. Perfect for students interested in tech careers.',
-                'start_time': now + timedelta(days=15),
-                'location': 'College of Computing',
-                'url': 'https://cc.gatech.edu/events',
-                'tags': ['technology', 'ai', 'workshop', 'academic'],
-                'host': 'College of Computing'
-            },
-            {
-                'title': 'Study Abroad Information Session',
-                'description': 'Learn about study abroad opportunities at Georgia Tech. Representatives from various programs will be available.',
-                'start_time': now + timedelta(days=8),
-                'location': 'Student Center',
-                'url': 'https://oie.gatech.edu/study-abroad',
-                'tags': ['academic', 'international', 'student', 'education'],
-                'host': 'Office of International Education'
-            },
-            {
-                'title': 'Georgia Tech vs Clemson Basketball',
-                'description': 'Exciting basketball matchup against Clemson Tigers. Come support the Yellow Jackets!',
-                'start_time': now + timedelta(days=42),
-                'location': 'McCamish Pavilion',
-                'url': 'https://ramblinwreck.com/sports/mens-basketball',
-                'tags': ['sports', 'basketball', 'athletics'],
-                'host': 'Georgia Tech Athletics'
-            }
-        ]
+        # one statement in one transaction: no ORM objects, no separate
+        # existence check; ids come from the events.id server default
+        with engine.begin() as conn:
+            added = set(conn.execute(
+                insert_statement(len(current_events)), insert_params(current_events)
+            ).scalars())
         
-        stored_count = 0
-        for event_data in current_events:
-            try:
-                # Check if event already exists
-                existing = db.query(Event).filter(
-                    Event.title == event_data['title'],
-                    Event.start_time == event_data['start_time']
-                ).first()
-                
-                if existing:
-                    print(f"Event '{event_data['title']}' already exists, skipping...")
-                    continue
-                
-                # Create new event
-                new_event = Event(
-                    id=uuid.uuid4(),
-                    title=event_data['title'],
-                    description=event_data['description'],
-                    start_time=event_data['start_time'],
-                    location=event_data['location'],
-                    host=event_data['host'],
-                    url=event_data['url'],
-                    tags=event_data['tags'],
-                )
-                db.add(new_event)
-                stored_count += 1
-                print(f"Added event: {event_data['title']}")
-                
-            except Exception as e:
-                print(f"Error storing event '{event_data.get('title', 'Unknown')}': {e}")
-                continue
+        for title, *_ in current_events:
+            if title in added:
+                print(f"Added event: {title}")
+            else:
+                print(f"Event '{title}' already exists, skipping...")
+        stored_count = len(added)
         
-        db.commit()
         print(f"✅ Successfully stored {stored_count} current Georgia Tech events!")
         
     except Exception as e:
-        db.rollback()
         print(f"❌ Error: {e}")
         sys.exit(1)
     finally:
-        db.close()
+        engine.dispose()
 
 if __name__ == "__main__":
     main()
-
-
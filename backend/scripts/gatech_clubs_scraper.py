@@ -18,7 +18,7 @@ import random
 
 import aiohttp
 from bs4 import BeautifulSoup
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, lambda_stmt, select, text
 from sqlalchemy.orm import sessionmaker
 
 # Add the parent directory to the path to import app modules
@@ -26,6 +26,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.db import get_db_url
 from app.models.event import Event
 
+# per-event existence check, built and compiled once; only the binds change per call
+_EVENT_EXISTS = lambda_stmt(
+    lambda: select(Event.id)
+    .where(Event.title == bindparam("t"), Event.start_time == bindparam("st"))
+    .limit(1)
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -453,9 +460,8 @@ class GatechClubsScraper:
         """Store a single event in the database"""
         try:
             # Check if event already exists
-            existing = self.db_session.query(Event).filter(
-                Event.title == event_data['title'],
-                Event.start_time == event_data['start_time']
+            existing = self.db_session.execute(
+                _EVENT_EXISTS, {"t": event_data['title'], "st": event_data['start_time']}
             ).first()
             
             if existing:
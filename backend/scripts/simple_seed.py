@@ -11,10 +11,17 @@ import uuid
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, lambda_stmt, select, text
 from sqlalchemy.orm import sessionmaker
 from app.models.event import Event
 
+# per-event existence check, built and compiled once; only the binds change per call
+_EVENT_EXISTS = lambda_stmt(
+    lambda: select(Event.id)
+    .where(Event.title == bindparam("t"), Event.start_time == bindparam("st"))
+    .limit(1)
+)
+
 def get_db_url():
     return "postgresql+psycopg2://postgres:postgres@db:5432/recs"
 
@@ -125,9 +132,8 @@ def main():
         for event_data in sample_events:
             try:
                 # Check if event already exists
-                existing = db.query(Event).filter(
-                    Event.title == event_data['title'],
-                    Event.start_time == event_data['start_time']
+                existing = db.execute(
+                    _EVENT_EXISTS, {"t": event_data['title'], "st": event_data['start_time']}
                 ).first()
                 
                 if existing:
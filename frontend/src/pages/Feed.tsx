@@ -67,8 +67,15 @@ export default function Feed() {
   async function ingestGatechEvents() {
     setIngesting(true);
     try {
-      const result = await postJSON("/ingestion/gatech-events", {});
-      alert(`Successfully ingested ${result.results?.total_events || 0} Georgia Tech events!`);
+      const { job_id } = await postJSON<{job_id: string}>("/ingestion/gatech-events", {});
+      // the scrape runs in the background; poll its job row until it settles
+      let job: {status: string, result?: any};
+      do {
+        await new Promise((r) => setTimeout(r, 2000));
+        job = await getJSON(`/ingestion/jobs/${job_id}`);
+      } while (job.status === "queued" || job.status === "running");
+      if (job.status !== "done") throw new Error(job.result?.error || "ingestion failed");
+      alert(`Successfully ingested ${job.result?.total_events || 0} Georgia Tech events!`);
       // Reload the feed to show new events
       await loadFeed(1);
     } catch (error) {